@@ -43,8 +43,16 @@ class ActualPointsService {
     let updated = 0;
 
     try {
-      // Fetch snapshot data
-      const snapshot = await gameweekSnapshot.getSnapshot(gameweek);
+      // Check for work first - in the common case every prediction already
+      // has actuals, and building a snapshot for nothing is the expensive part
+      const predictionsToUpdate = await storage.getPredictionsWithoutActuals(userId, gameweek);
+
+      if (predictionsToUpdate.length === 0) {
+        return { updated: 0, errors: [] };
+      }
+
+      // Fetch snapshot data (no Understat needed to read gameweek status)
+      const snapshot = await gameweekSnapshot.getSnapshot(gameweek, false);
       const gameweeks = snapshot.data.gameweeks;
       const targetGameweek = gameweeks.find(gw => gw.id === gameweek);
 
@@ -56,34 +64,28 @@ class ActualPointsService {
         return { updated: 0, errors: ['Gameweek has not finished yet'] };
       }
 
-      const predictionsToUpdate = await storage.getPredictionsWithoutActuals(userId, gameweek);
-
-      if (predictionsToUpdate.length === 0) {
-        return { updated: 0, errors: [] };
-      }
-
       const actualPointsMap = await this.fetchActualGameweekPoints(gameweek);
 
+      const updates: PlayerActualPoints[] = [];
       for (const prediction of predictionsToUpdate) {
         const actualPoints = actualPointsMap.get(prediction.playerId);
 
         if (actualPoints !== undefined) {
-          try {
-            await storage.updateActualPointsByPlayer(
-              userId,
-              gameweek,
-              prediction.playerId,
-              actualPoints
-            );
-            updated++;
-          } catch (error) {
-            errors.push(`Failed to update prediction for player ${prediction.playerId}: ${error}`);
-          }
+          updates.push({ playerId: prediction.playerId, actualPoints });
         } else {
           errors.push(`No actual points found for player ${prediction.playerId}`);
         }
       }
 
+      if (updates.length > 0) {
+        try {
+          await storage.bulkUpdateActualPoints(userId, gameweek, updates);
+          updated = updates.length;
+        } catch (error) {
+          errors.push(`Failed to update ${updates.length} predictions: ${error}`);
+        }
+      }
+
       return { updated, errors };
     } catch (error) {
       console.error('Error updating actual points:', error);
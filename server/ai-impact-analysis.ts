@@ -32,11 +32,12 @@ export class AIImpactAnalysisService {
    * Analyze the impact of AI recommendations for a completed gameweek
    * Calculates actual points WITH AI vs WITHOUT AI recommendations
    */
-  async analyzeGameweekImpact(planId: number): Promise<ImpactAnalysisResult> {
+  async analyzeGameweekImpact(planId: number, prefetchedPlan?: GameweekPlan): Promise<ImpactAnalysisResult> {
     console.log(`[AIImpactAnalysis] Starting analysis for plan ${planId}`);
 
-    // 1. Get the gameweek plan
-    const plan = await storage.getGameweekPlanById(planId);
+    // 1. Get the gameweek plan (batch callers pass the row they already hold
+    // so the loop doesn't re-query each plan by id)
+    const plan = prefetchedPlan ?? await storage.getGameweekPlanById(planId);
     if (!plan) {
       throw new Error(`Plan ${planId} not found`);
     }
@@ -331,7 +332,7 @@ export class AIImpactAnalysisService {
       }
 
       try {
-        const result = await this.analyzeGameweekImpact(plan.id);
+        const result = await this.analyzeGameweekImpact(plan.id, plan);
         results.push(result);
       } catch (error) {
         console.error(`[AIImpactAnalysis] Error analyzing plan ${plan.id}:`, error);
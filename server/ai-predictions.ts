@@ -1,11 +1,13 @@
 import OpenAI from "openai";
 import Anthropic from "@anthropic-ai/sdk";
 import { storage } from "./storage";
+import { fplApi } from "./fpl-api";
 import { understatService } from "./understat-api";
 import { snapshotContext, type SnapshotContext } from "./snapshot-context";
 import { decisionLogger } from "./decision-logger";
 import { calibrationService } from "./calibration-service";
 import { statisticalPredictor } from "./statistical-predictor";
+import type { MinutesProbability } from "./minutes-estimator";
 import type {
   FPLPlayer,
   FPLFixture,
@@ -16,6 +18,16 @@ import type {
   ChipStrategy,
 } from "@shared/schema";
 
+// Verbose AI payload dumps are gated behind AI_DEBUG_LOGGING. The payload is
+// passed as a thunk so the JSON.stringify rendering cost is only paid when
+// the dump is actually wanted, not on every prediction call.
+const AI_DEBUG_LOGGING = process.env.AI_DEBUG_LOGGING === 'true';
+
+function debugLog(label: string, payload: () => unknown): void {
+  if (!AI_DEBUG_LOGGING) return;
+  console.log(label, payload());
+}
+
 const openai = process.env.OPENAI_API_KEY
   ? new OpenAI({
       apiKey: process.env.OPENAI_API_KEY,
@@ -69,6 +81,8 @@ interface PredictionContext {
   userId?: number;
   gameweek?: number;
   snapshotId?: string;
+  preloadedMinutes?: MinutesProbability;
+  preloadedTeams?: FPLTeam[];
   teamStrength?: {
     attack_home: number;
     attack_away: number;
@@ -87,13 +101,15 @@ export class AIPredictionService {
   }
 
   private async predictPlayerPointsStatistical(context: PredictionContext): Promise<Prediction> {
-    const { fplApi } = await import("./fpl-api");
-    const allTeams = await fplApi.getTeams();
+    // Batch callers resolve the team list once up front; fall back to the
+    // API (bootstrap cache) for one-off predictions
+    const allTeams = context.preloadedTeams ?? await fplApi.getTeams();
 
     const detailedPrediction = await statisticalPredictor.predictPlayerPointsStatistical(
       context.player,
       context.upcomingFixtures,
-      allTeams
+      allTeams,
+      context.preloadedMinutes
     );
 
     if (context.userId && context.gameweek) {
@@ -395,27 +411,41 @@ Provide exactly 3 transfer recommendations in this JSON format:
     try {
       const response = await getAICompletion(prompt);
       const result = extractJSONFromResponse(response);
-      console.log('[AI] Transfer recommendations result:', JSON.stringify(result, null, 2));
+      debugLog('[AI] Transfer recommendations result:', () => JSON.stringify(result, null, 2));
       
       const recommendations = Array.isArray(result.recommendations) ? result.recommendations : [];
 
       if (userId && gameweek && recommendations.length > 0) {
+        // Index players by id and upcoming fixtures by team once, instead of
+        // rescanning the full player and fixture lists for every recommendation
+        const allPlayersById = new Map(allPlayers.map(p => [p.id, p]));
+        const currentPlayersById = new Map(currentPlayers.map(p => [p.id, p]));
+        const upcomingFixturesByTeam = new Map<number, FPLFixture[]>();
+        for (const fixture of fixtures) {
+          if (!fixture.event || fixture.event < gameweek || fixture.finished) continue;
+          for (const teamId of [fixture.team_h, fixture.team_a]) {
+            const list = upcomingFixturesByTeam.get(teamId);
+            if (list) {
+              list.push(fixture);
+            } else {
+              upcomingFixturesByTeam.set(teamId, [fixture]);
+            }
+          }
+        }
+
         for (const rec of recommendations) {
           try {
-            const playerIn = allPlayers.find(p => p.id === rec.player_in_id);
-            const playerOut = currentPlayers.find(p => p.id === rec.player_out_id);
+            const playerIn = allPlayersById.get(rec.player_in_id);
+            const playerOut = currentPlayersById.get(rec.player_out_id);
 
             if (playerIn && playerOut) {
               // Calculate multi-gameweek predictions using statistical model
-              const upcomingFixtures = fixtures.filter(f => f.event && f.event >= gameweek && !f.finished);
               const numGameweeks = 3; // Standard timeframe for transfer evaluation
 
-              const playerInFixtures = upcomingFixtures
-                .filter(f => f.team_h === playerIn.team || f.team_a === playerIn.team)
+              const playerInFixtures = (upcomingFixturesByTeam.get(playerIn.team) ?? [])
                 .slice(0, numGameweeks);
 
-              const playerOutFixtures = upcomingFixtures
-                .filter(f => f.team_h === playerOut.team || f.team_a === playerOut.team)
+              const playerOutFixtures = (upcomingFixturesByTeam.get(playerOut.team) ?? [])
                 .slice(0, numGameweeks);
 
               const [playerInPrediction, playerOutPrediction] = await Promise.all([
@@ -552,26 +582,26 @@ Provide exactly 3 captain recommendations in this JSON format:
     try {
       const response = await getAICompletion(prompt);
       const result = extractJSONFromResponse(response);
-      console.log('[AI] Captain recommendations result:', JSON.stringify(result, null, 2));
+      debugLog('[AI] Captain recommendations result:', () => JSON.stringify(result, null, 2));
       
       const recommendations = Array.isArray(result.recommendations) ? result.recommendations : [];
 
       if (userId && gameweek && recommendations.length > 0) {
-        for (const rec of recommendations) {
-          try {
-            await storage.upsertPrediction({
-              userId,
-              gameweek,
-              playerId: rec.player_id,
-              predictedPoints: Math.round(rec.expected_points),
-              actualPoints: null,
-              confidence: rec.confidence,
-              snapshotId: context.snapshotId,
-            });
-            console.log(`[Captain] Saved captain recommendation prediction for player ${rec.player_id} with snapshot ${context.snapshotId}`);
-          } catch (error) {
-            console.error(`Error saving captain recommendation prediction for player ${rec.player_id}:`, error);
-          }
+        try {
+          // Save the whole shortlist in one multi-row upsert instead of a
+          // statement per recommendation
+          await storage.upsertPredictions(recommendations.map((rec: any) => ({
+            userId,
+            gameweek,
+            playerId: rec.player_id,
+            predictedPoints: Math.round(rec.expected_points),
+            actualPoints: null,
+            confidence: rec.confidence,
+            snapshotId: context.snapshotId,
+          })));
+          console.log(`[Captain] Saved ${recommendations.length} captain recommendation predictions with snapshot ${context.snapshotId}`);
+        } catch (error) {
+          console.error('Error saving captain recommendation predictions:', error);
         }
       }
 
@@ -655,7 +685,6 @@ Provide chip strategy in JSON format:
     formation: string,
     onChunk: (data: string) => void
   ): Promise<void> {
-    const { fplApi } = await import("./fpl-api");
     const fixtures = await fplApi.getFixtures();
     const teams = await fplApi.getTeams();
     
@@ -811,7 +840,6 @@ JSON format (be concise):
     viceCaptainId?: number | null
   ): Promise<{ insights: string[]; predicted_points: number; confidence: number }> {
     // Get upcoming fixtures and team data for comprehensive analysis
-    const { fplApi } = await import("./fpl-api");
     const fixtures = await fplApi.getFixtures();
     const teams = await fplApi.getTeams();
     
@@ -914,15 +942,15 @@ JSON format (be concise):
         seed: 42, // Perfect reproducibility for same inputs
       });
 
-      console.log('[AI] Full response:', JSON.stringify(response, null, 2));
-      console.log('[AI] Choices:', response.choices);
-      console.log('[AI] First choice:', response.choices[0]);
-      console.log('[AI] Message:', response.choices[0]?.message);
-      
+      debugLog('[AI] Full response:', () => JSON.stringify(response, null, 2));
+      debugLog('[AI] Choices:', () => response.choices);
+      debugLog('[AI] First choice:', () => response.choices[0]);
+      debugLog('[AI] Message:', () => response.choices[0]?.message);
+
       const rawContent = response.choices[0]?.message?.content || "{}";
-      console.log('[AI] Raw response content:', rawContent);
+      debugLog('[AI] Raw response content:', () => rawContent);
       const result = JSON.parse(rawContent);
-      console.log('[AI] Parsed result:', JSON.stringify(result));
+      debugLog('[AI] Parsed result:', () => JSON.stringify(result));
       console.log('[AI] Team analysis complete:', result.predicted_points, 'pts,', result.confidence, '% confidence');
       
       return {
@@ -66,6 +66,18 @@ export interface DecisionLogEntry {
  * confidence scores, and input fingerprints for replay capability.
  */
 class DecisionLogger {
+  /**
+   * Queue of entries awaiting persistence
+   *
+   * Decision logs are an audit trail, not part of any response, so the
+   * decision path only enqueues here and a background drain owns the
+   * database writes. Entries are persisted in the order they were logged.
+   *
+   * @private
+   */
+  private pendingEntries: DecisionLogEntry[] = [];
+  private draining = false;
+
   /**
    * Log a gameweek plan decision
    * 
@@ -228,16 +240,42 @@ class DecisionLogger {
   }
 
   /**
-   * Persist decision log entry to database
-   * 
-   * Saves the decision entry to the aiDecisionLedger table via storage layer.
-   * 
+   * Queue a decision log entry for persistence
+   *
+   * Enqueues the entry and schedules the background drain, so callers on
+   * the decision path never block on the aiDecisionLedger write.
+   *
    * @param entry - The decision log entry to persist
-   * 
+   *
    * @private
    */
   private async log(entry: DecisionLogEntry): Promise<void> {
-    await storage.saveDecisionLog(entry);
+    this.pendingEntries.push(entry);
+    if (!this.draining) {
+      this.draining = true;
+      setImmediate(() => this.drainQueue());
+    }
+  }
+
+  /**
+   * Drain queued entries to the database
+   *
+   * Writes entries one at a time in logged order. A failed write is
+   * reported and dropped rather than retried, so one bad entry cannot
+   * stall the rest of the queue.
+   *
+   * @private
+   */
+  private async drainQueue(): Promise<void> {
+    while (this.pendingEntries.length > 0) {
+      const entry = this.pendingEntries.shift()!;
+      try {
+        await storage.saveDecisionLog(entry);
+      } catch (error) {
+        console.error(`[DecisionLogger] Failed to persist ${entry.decisionType} decision for user ${entry.userId}:`, error);
+      }
+    }
+    this.draining = false;
   }
 }
 
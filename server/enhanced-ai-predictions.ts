@@ -1,6 +1,25 @@
 import { statisticalPredictor } from "./statistical-predictor";
 import type { FPLPlayer, FPLFixture, FPLTeam, Prediction } from "@shared/schema";
 
+// Model blend and fixture-difficulty constants hoisted to module scope so the
+// per-player prediction helpers don't rebuild these literals on every call
+const ENSEMBLE_WEIGHTS = {
+  statistical: 0.5,
+  form_based: 0.25,
+  fixture_adjusted: 0.25,
+} as const;
+
+const FORM_RECENT_WEIGHT = 0.7;
+const FORM_SEASON_WEIGHT = 0.3;
+
+const DIFFICULTY_MULTIPLIERS: Record<number, number> = {
+  1: 1.3,
+  2: 1.15,
+  3: 1.0,
+  4: 0.85,
+  5: 0.7,
+};
+
 export interface EnhancedPrediction extends Prediction {
   confidence_interval: {
     lower: number;
@@ -67,9 +86,7 @@ class EnhancedAIPredictionService {
   private calculateFormBasedPrediction(player: FPLPlayer): number {
     const form = parseFloat(player.form);
     const ppg = parseFloat(player.points_per_game);
-    const recentWeight = 0.7;
-    const seasonWeight = 0.3;
-    return form * recentWeight + ppg * seasonWeight;
+    return form * FORM_RECENT_WEIGHT + ppg * FORM_SEASON_WEIGHT;
   }
 
   private calculateFixtureAdjustedPrediction(
@@ -83,18 +100,10 @@ class EnhancedAIPredictionService {
     const isHome = nextFixture.team_h === player.team;
     const difficulty = isHome ? nextFixture.team_h_difficulty : nextFixture.team_a_difficulty;
 
-    const difficultyMultipliers: Record<number, number> = {
-      1: 1.3,
-      2: 1.15,
-      3: 1.0,
-      4: 0.85,
-      5: 0.7,
-    };
-
     const homeBonus = isHome ? 1.1 : 1.0;
     const ppg = parseFloat(player.points_per_game);
 
-    return ppg * (difficultyMultipliers[difficulty] || 1.0) * homeBonus;
+    return ppg * (DIFFICULTY_MULTIPLIERS[difficulty] || 1.0) * homeBonus;
   }
 
   private calculateEnsemblePrediction(models: {
@@ -102,16 +111,10 @@ class EnhancedAIPredictionService {
     form_based: number;
     fixture_adjusted: number;
   }): number {
-    const weights = {
-      statistical: 0.5,
-      form_based: 0.25,
-      fixture_adjusted: 0.25,
-    };
-
     return (
-      models.statistical * weights.statistical +
-      models.form_based * weights.form_based +
-      models.fixture_adjusted * weights.fixture_adjusted
+      models.statistical * ENSEMBLE_WEIGHTS.statistical +
+      models.form_based * ENSEMBLE_WEIGHTS.form_based +
+      models.fixture_adjusted * ENSEMBLE_WEIGHTS.fixture_adjusted
     );
   }
 
@@ -120,9 +123,16 @@ class EnhancedAIPredictionService {
     models: { statistical: number; form_based: number; fixture_adjusted: number }
   ): number {
     const predictions = [models.statistical, models.form_based, models.fixture_adjusted];
-    const mean = predictions.reduce((sum, val) => sum + val, 0) / predictions.length;
-    const squaredDiffs = predictions.map(val => Math.pow(val - mean, 2));
-    const variance = squaredDiffs.reduce((sum, val) => sum + val, 0) / predictions.length;
+    // Welford's online algorithm: one pass, no intermediate arrays, and
+    // numerically stable when the predictions are large and close together
+    let mean = 0;
+    let m2 = 0;
+    for (let i = 0; i < predictions.length; i++) {
+      const delta = predictions[i] - mean;
+      mean += delta / (i + 1);
+      m2 += (predictions[i] - mean) * delta;
+    }
+    const variance = m2 / predictions.length;
 
     const formFactor = Math.abs(parseFloat(player.form) - parseFloat(player.points_per_game));
     return variance + formFactor * 0.5;
@@ -26,12 +26,16 @@ interface BootstrapData {
 class FPLApiService {
   private bootstrapCache: BootstrapData | null = null;
   private cacheTimestamp: number = 0;
+  private bootstrapInFlight: Promise<BootstrapData> | null = null;
+  // Fixtures cached per gameweek (or 'all') - they rarely change between polls
+  private fixturesCache: Map<string, { data: FPLFixture[]; timestamp: number }> = new Map();
   private readonly CACHE_DURATION = 5 * 60 * 1000; // 5 minutes
 
   clearCache(): void {
-    console.log('[FPL API] Clearing bootstrap cache');
+    console.log('[FPL API] Clearing bootstrap and fixtures caches');
     this.bootstrapCache = null;
     this.cacheTimestamp = 0;
+    this.fixturesCache.clear();
   }
 
   async getBootstrapData(forceRefresh: boolean = false): Promise<BootstrapData> {
@@ -40,6 +44,21 @@ class FPLApiService {
       return this.bootstrapCache;
     }
 
+    // Deduplicate concurrent refreshes: callers arriving while a fetch is in
+    // flight share that request instead of each opening their own connection
+    if (!forceRefresh && this.bootstrapInFlight) {
+      return this.bootstrapInFlight;
+    }
+
+    this.bootstrapInFlight = this.fetchBootstrapData();
+    try {
+      return await this.bootstrapInFlight;
+    } finally {
+      this.bootstrapInFlight = null;
+    }
+  }
+
+  private async fetchBootstrapData(): Promise<BootstrapData> {
     console.log('[FPL API] Fetching fresh bootstrap data from FPL API');
     const response = await fetch(`${FPL_BASE_URL}/bootstrap-static/`);
     if (!response.ok) {
@@ -48,7 +67,7 @@ class FPLApiService {
 
     const data = await response.json();
     this.bootstrapCache = data;
-    this.cacheTimestamp = now;
+    this.cacheTimestamp = Date.now();
     return data;
   }
 
@@ -91,16 +110,24 @@ class FPLApiService {
   }
 
   async getFixtures(gameweek?: number): Promise<FPLFixture[]> {
+    const cacheKey = gameweek ? String(gameweek) : 'all';
+    const cached = this.fixturesCache.get(cacheKey);
+    if (cached && Date.now() - cached.timestamp < this.CACHE_DURATION) {
+      return cached.data;
+    }
+
     const url = gameweek
       ? `${FPL_BASE_URL}/fixtures/?event=${gameweek}`
       : `${FPL_BASE_URL}/fixtures/`;
-    
+
     const response = await fetch(url);
     if (!response.ok) {
       throw new Error(`FPL API error: ${response.statusText}`);
     }
 
-    return response.json();
+    const fixtures: FPLFixture[] = await response.json();
+    this.fixturesCache.set(cacheKey, { data: fixtures, timestamp: Date.now() });
+    return fixtures;
   }
 
   async getPlayerDetails(playerId: number) {
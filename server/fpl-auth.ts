@@ -4,6 +4,17 @@ import { chromium } from 'playwright-core';
 
 const FPL_LOGIN_URL = 'https://users.premierleague.com/accounts/login/';
 const COOKIE_EXPIRY_DAYS = 7;
+
+// Built once at module load so repeated login/refresh attempts reuse the same
+// header objects instead of re-allocating identical literals per call
+const BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36';
+const COOKIE_TEST_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36';
+const REFRESH_HEADERS = {
+  'Content-Type': 'application/x-www-form-urlencoded',
+  'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+  'Referer': 'https://fantasy.premierleague.com/',
+  'Origin': 'https://fantasy.premierleague.com',
+} as const;
 const ALGORITHM = 'aes-256-gcm';
 const IV_LENGTH = 16;
 const AUTH_TAG_LENGTH = 16;
@@ -164,6 +175,16 @@ function validateAndNormalizeCookies(rawCookies: string): CookieValidationResult
 }
 
 class FPLAuthService {
+  // Short-lived in-process cache of decoded session cookies. Callers like
+  // manager sync fetch cookies on every request; within the TTL we can skip
+  // the credentials SELECT entirely. Invalidated whenever credentials change.
+  private sessionCookieCache = new Map<number, { cookies: string; cachedAt: number }>();
+  private readonly SESSION_CACHE_TTL = 5 * 60 * 1000; // 5 minutes
+
+  private invalidateSessionCache(userId: number): void {
+    this.sessionCookieCache.delete(userId);
+  }
+
   async login(email: string, password: string, userId: number): Promise<void> {
     console.log(`[FPL Auth] Attempting login for user ${userId} using browser automation`);
     
@@ -187,7 +208,7 @@ class FPLAuthService {
       console.log(`[FPL Auth] Local browser launched successfully`);
 
       const context = await browser.newContext({
-        userAgent: 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+        userAgent: BROWSER_USER_AGENT,
         viewport: { width: 1920, height: 1080 },
         locale: 'en-GB',
         extraHTTPHeaders: {
@@ -359,6 +380,7 @@ class FPLAuthService {
         sessionCookies: cookieString,
         cookiesExpiresAt,
       });
+      this.invalidateSessionCache(userId);
 
       console.log(`[FPL Auth] ✓ Login successful for user ${userId}, session expires ${cookiesExpiresAt.toISOString()}`);
     } catch (error) {
@@ -403,8 +425,13 @@ class FPLAuthService {
   }
 
   async getSessionCookies(userId: number): Promise<string> {
+    const cached = this.sessionCookieCache.get(userId);
+    if (cached && Date.now() - cached.cachedAt < this.SESSION_CACHE_TTL) {
+      return cached.cookies;
+    }
+
     const credentials = await storage.getFplCredentials(userId);
-    
+
     if (!credentials || !credentials.sessionCookies) {
       throw new Error(`No FPL credentials found for user ${userId}. Please login first.`);
     }
@@ -414,17 +441,17 @@ class FPLAuthService {
 
     if (!expiresAt || expiresAt <= now) {
       console.log(`[FPL Auth] Session expired for user ${userId}, refreshing...`);
-      await this.refreshSession(userId);
-      
-      const refreshedCredentials = await storage.getFplCredentials(userId);
-      if (!refreshedCredentials || !refreshedCredentials.sessionCookies) {
-        throw new Error('Failed to refresh session cookies');
-      }
-      
-      return decodeURIComponent(refreshedCredentials.sessionCookies);
+      // refreshSession hands back the fresh cookie string, so no need to
+      // re-read the credentials row we just wrote
+      const refreshedCookies = await this.refreshSession(userId);
+      const decodedRefreshed = decodeURIComponent(refreshedCookies);
+      this.sessionCookieCache.set(userId, { cookies: decodedRefreshed, cachedAt: Date.now() });
+      return decodedRefreshed;
     }
 
-    return decodeURIComponent(credentials.sessionCookies);
+    const decoded = decodeURIComponent(credentials.sessionCookies);
+    this.sessionCookieCache.set(userId, { cookies: decoded, cachedAt: Date.now() });
+    return decoded;
   }
 
   extractCsrfToken(cookies: string): string | null {
@@ -444,7 +471,7 @@ class FPLAuthService {
     return token;
   }
 
-  async refreshSession(userId: number): Promise<void> {
+  async refreshSession(userId: number): Promise<string> {
     console.log(`[FPL Auth] Refreshing session for user ${userId}`);
     
     const credentials = await storage.getFplCredentials(userId);
@@ -471,12 +498,7 @@ class FPLAuthService {
 
       const response = await fetch(FPL_LOGIN_URL, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/x-www-form-urlencoded',
-          'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-          'Referer': 'https://fantasy.premierleague.com/',
-          'Origin': 'https://fantasy.premierleague.com',
-        },
+        headers: REFRESH_HEADERS,
         body: formData.toString(),
       });
 
@@ -508,8 +530,13 @@ class FPLAuthService {
         sessionCookies: cookieString,
         cookiesExpiresAt,
       });
+      this.sessionCookieCache.set(userId, {
+        cookies: decodeURIComponent(cookieString),
+        cachedAt: Date.now(),
+      });
 
       console.log(`[FPL Auth] ✓ Session refreshed for user ${userId}, expires ${cookiesExpiresAt.toISOString()}`);
+      return cookieString;
     } catch (error) {
       console.error(`[FPL Auth] ✗ Session refresh error for user ${userId}:`, error);
       throw error;
@@ -532,7 +559,7 @@ class FPLAuthService {
       const testResponse = await fetch('https://fantasy.premierleague.com/api/me/', {
         headers: {
           'Cookie': normalizedCookies,
-          'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+          'User-Agent': COOKIE_TEST_USER_AGENT,
         },
       });
 
@@ -559,6 +586,7 @@ class FPLAuthService {
         sessionCookies: normalizedCookies,
         cookiesExpiresAt,
       });
+      this.invalidateSessionCache(userId);
 
       console.log(`[FPL Auth] ✓ Manual authentication successful for user ${userId}, session expires ${cookiesExpiresAt.toISOString()}`);
     } catch (error) {
@@ -569,7 +597,8 @@ class FPLAuthService {
 
   async logout(userId: number): Promise<void> {
     console.log(`[FPL Auth] Logging out user ${userId}`);
-    
+
+    this.invalidateSessionCache(userId);
     const deleted = await storage.deleteFplCredentials(userId);
     
     if (deleted) {
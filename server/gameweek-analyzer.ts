@@ -1,6 +1,6 @@
 import OpenAI from "openai";
 import Anthropic from "@anthropic-ai/sdk";
-import { storage } from "./storage";
+import { storage, type GameweekPlanResultUpdates } from "./storage";
 import { fplApi } from "./fpl-api";
 import { leagueAnalysis } from "./league-analysis";
 import { competitorPredictor } from "./competitor-predictor";
@@ -9,7 +9,8 @@ import { aiLearningFeedback } from "./ai-learning-feedback";
 import { snapshotContext, type SnapshotContext } from "./snapshot-context";
 import { snapshotValidator } from "./snapshot-validator";
 import { decisionLogger } from "./decision-logger";
-import { AIPredictionService } from "./ai-predictions";
+import { aiPredictions as aiPredictionService } from "./ai-predictions";
+import { minutesEstimator } from "./minutes-estimator";
 import type {
   FPLPlayer,
   FPLFixture,
@@ -32,7 +33,14 @@ const anthropic = process.env.ANTHROPIC_API_KEY
   ? new Anthropic({ apiKey: process.env.ANTHROPIC_API_KEY })
   : null;
 
-const aiPredictionService = new AIPredictionService();
+// Position labels indexed by element_type, hoisted so the substitution
+// analysis loops don't rebuild the table per transfer
+const POSITION_NAMES = ['', 'GK', 'DEF', 'MID', 'FWD'] as const;
+
+// Full position names and FPL squad composition, hoisted alongside
+// POSITION_NAMES so prompt assembly doesn't rebuild them per call
+const POSITION_FULL_NAMES: Record<number, string> = { 1: 'Goalkeeper', 2: 'Defender', 3: 'Midfielder', 4: 'Forward' };
+const SQUAD_REQUIRED_COUNTS: Record<number, number> = { 1: 2, 2: 5, 3: 5, 4: 3 };
 
 function calculateSuspensionRisk(yellowCards: number, currentGameweek: number): {
   risk: 'critical' | 'high' | 'moderate' | 'low';
@@ -228,6 +236,11 @@ export type CustomLineupPlayer = {
 };
 
 export class GameweekAnalyzerService {
+  // Per-player predictions are independent once minutes history is preloaded,
+  // so run them in bounded concurrent batches; each still writes its own
+  // prediction row, the bound just keeps DB/API pressure reasonable
+  private static readonly PREDICTION_CONCURRENCY = 8;
+
   async analyzeGameweek(userId: number, gameweek: number, targetPlayerId?: number, customLineup?: CustomLineupPlayer[]): Promise<GameweekPlan> {
     try {
       const isWhatIfAnalysis = !!customLineup;
@@ -258,6 +271,14 @@ export class GameweekAnalyzerService {
       let allValidationErrors: string[] = [];
       let predictionsMap = new Map<number, number>(); // Will be populated inside retry loop
 
+      // Attempt-invariant indexes: the snapshot player list and upcoming
+      // fixtures don't change between retry attempts, so build these once
+      // rather than once per attempt
+      const snapshotPlayersById = new Map<number, FPLPlayer>(
+        inputData.context.snapshot.data.players.map((p: FPLPlayer) => [p.id, p])
+      );
+      const fixturesByTeam = this.indexUpcomingFixturesByTeam(inputData.upcomingFixtures, gameweek);
+
       for (let attempt = 1; attempt <= maxAttempts; attempt++) {
         console.log(`[GameweekAnalyzer] Attempt ${attempt}/${maxAttempts} to generate valid plan`);
 
@@ -311,18 +332,23 @@ export class GameweekAnalyzerService {
           
           console.log(`[GameweekAnalyzer] Need predictions for ${allRelevantPlayerIds.size} players (${currentSquadPlayerIds.length} current squad + ${transferredOutPlayerIds.size} transferred-out + ${transferredInPlayerIds.size} transferred-in)`);
           
-          // Fetch existing predictions to avoid regenerating
-          const existingPredictions = await storage.getPredictionsByGameweek(userId, gameweek);
-          const existingPredictionsSet = new Set(
-            existingPredictions
-              .filter(p => p.snapshotId === inputData.context.snapshotId)
-              .map(p => p.playerId)
+          // Fetch existing predictions to avoid regenerating - the snapshot
+          // filter runs in the query (snapshotId is indexed) rather than in JS
+          const existingPredictions = await storage.getPredictionsBySnapshot(
+            userId,
+            gameweek,
+            inputData.context.snapshotId
           );
+          const existingPredictionsSet = new Set(existingPredictions.map(p => p.playerId));
           
           // Generate predictions for players that don't have them yet
           let predictionsGenerated = 0;
           let predictionsSkipped = 0;
-          
+
+          // Resolve the cohort up front so the minutes history for the whole
+          // batch loads in a single query rather than per prediction
+          const playersNeedingPredictions: FPLPlayer[] = [];
+
           for (const playerId of Array.from(allRelevantPlayerIds)) {
             // Check if prediction already exists for this player + gameweek + snapshot
             if (existingPredictionsSet.has(playerId)) {
@@ -330,53 +356,57 @@ export class GameweekAnalyzerService {
               predictionsSkipped++;
               continue;
             }
-            
-            // Find player data
-            const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === playerId);
+
+            const player = snapshotPlayersById.get(playerId);
             if (!player) {
               console.warn(`  ⚠️  Player ${playerId} not found in snapshot - skipping`);
               continue;
             }
-            
-            // Get upcoming fixtures for this player
-            const upcomingFixtures = inputData.upcomingFixtures
-              .filter((f: FPLFixture) => 
-                !f.finished && 
-                f.event && 
-                f.event >= gameweek && 
-                (f.team_h === player.team || f.team_a === player.team)
-              )
-              .slice(0, 3);
-            
-            try {
-              console.log(`  🎯 Generating prediction for ${player.web_name} (ID: ${playerId})...`);
-              
-              // Generate prediction using AI service (AWAIT to ensure completion)
-              await aiPredictionService.predictPlayerPoints({
-                player,
-                upcomingFixtures,
-                userId,
-                gameweek,
-                snapshotId: inputData.context.snapshotId,
-              });
-              
-              predictionsGenerated++;
-              console.log(`  ✅ Prediction generated for ${player.web_name}`);
-            } catch (error) {
-              console.error(`  ❌ Failed to generate prediction for ${player.web_name} (ID: ${playerId}):`, error instanceof Error ? error.message : 'Unknown error');
-              // Continue with other players even if one fails
-            }
+
+            playersNeedingPredictions.push(player);
+          }
+
+          const minutesByPlayer = await minutesEstimator.estimateMinutesBulk(playersNeedingPredictions);
+
+          for (let i = 0; i < playersNeedingPredictions.length; i += GameweekAnalyzerService.PREDICTION_CONCURRENCY) {
+            const batch = playersNeedingPredictions.slice(i, i + GameweekAnalyzerService.PREDICTION_CONCURRENCY);
+            await Promise.all(batch.map(async player => {
+              // Get upcoming fixtures for this player
+              const upcomingFixtures = (fixturesByTeam.get(player.team) ?? []).slice(0, 3);
+
+              try {
+                console.log(`  🎯 Generating prediction for ${player.web_name} (ID: ${player.id})...`);
+
+                // Generate prediction using AI service (AWAIT to ensure completion)
+                await aiPredictionService.predictPlayerPoints({
+                  player,
+                  upcomingFixtures,
+                  userId,
+                  gameweek,
+                  snapshotId: inputData.context.snapshotId,
+                  preloadedMinutes: minutesByPlayer.get(player.id),
+                  preloadedTeams: inputData.context.snapshot.data.teams,
+                });
+
+                predictionsGenerated++;
+                console.log(`  ✅ Prediction generated for ${player.web_name}`);
+              } catch (error) {
+                console.error(`  ❌ Failed to generate prediction for ${player.web_name} (ID: ${player.id}):`, error instanceof Error ? error.message : 'Unknown error');
+                // Continue with other players even if one fails
+              }
+            }));
           }
           
           console.log(`\n[GameweekAnalyzer] 📊 Prediction generation complete: ${predictionsGenerated} generated, ${predictionsSkipped} skipped`);
           
           // Fetch all predictions from storage (including newly generated ones)
           // CRITICAL: This must happen AFTER all predictions are generated
-          const savedPredictions = await storage.getPredictionsByGameweek(userId, gameweek);
-          const relevantPredictions = savedPredictions.filter(p => 
-            allRelevantPlayerIds.has(p.playerId) && 
-            p.snapshotId === inputData.context.snapshotId
+          const savedPredictions = await storage.getPredictionsBySnapshot(
+            userId,
+            gameweek,
+            inputData.context.snapshotId
           );
+          const relevantPredictions = savedPredictions.filter(p => allRelevantPlayerIds.has(p.playerId));
           
           // Build predictionsMap from fetched results
           // DO NOT add estimates for transferred-in players - validation must use actual predictions only
@@ -689,77 +719,86 @@ export class GameweekAnalyzerService {
       // 6.7. Generate predictions for transferred-out players (for transfer card display)
       // Current squad predictions were already generated before retry loop
       console.log(`\n[GameweekAnalyzer] 🔮 Generating predictions for ${transferredOutIds.size} transferred-out players (for transfer card display)...`);
-      
+
       if (transferredOutIds.size > 0) {
         // Check which transferred-out players need predictions
-        const transferredOutPredictionsGenerated = await storage.getPredictionsByGameweek(userId, gameweek);
+        const transferredOutPredictionsGenerated = await storage.getPredictionsBySnapshot(
+          userId,
+          gameweek,
+          inputData.context.snapshotId
+        );
         const transferredOutPredictionsSet = new Set(
-          transferredOutPredictionsGenerated
-            .filter(p => p.snapshotId === inputData.context.snapshotId)
-            .map(p => p.playerId)
+          transferredOutPredictionsGenerated.map(p => p.playerId)
         );
         
         let transferredOutPredictionsCreated = 0;
-        
+
+        // Same batching as the main prediction loop: resolve the cohort, then
+        // preload everyone's minutes history in one query
+        const transferredOutNeedingPredictions: FPLPlayer[] = [];
         for (const playerId of Array.from(transferredOutIds)) {
           // Check if prediction already exists for this player + gameweek + snapshot
           if (transferredOutPredictionsSet.has(playerId)) {
             console.log(`  ⏭️  Transferred-out player ${playerId} already has prediction - skipping`);
             continue;
           }
-          
-          // Find player data
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === playerId);
+
+          const player = snapshotPlayersById.get(playerId);
           if (!player) {
             console.warn(`  ⚠️  Transferred-out player ${playerId} not found in snapshot - skipping`);
             continue;
           }
-          
-          // Get upcoming fixtures for this player
-          const upcomingFixtures = inputData.upcomingFixtures
-            .filter((f: FPLFixture) => 
-              !f.finished && 
-              f.event && 
-              f.event >= gameweek && 
-              (f.team_h === player.team || f.team_a === player.team)
-            )
-            .slice(0, 3);
-          
-          try {
-            console.log(`  🎯 Generating prediction for transferred-out ${player.web_name} (ID: ${playerId})...`);
-            
-            // Generate prediction using AI service
-            await aiPredictionService.predictPlayerPoints({
-              player,
-              upcomingFixtures,
-              userId,
-              gameweek,
-              snapshotId: inputData.context.snapshotId,
-            });
-            
-            transferredOutPredictionsCreated++;
-            console.log(`  ✅ Prediction generated for ${player.web_name}`);
-          } catch (error) {
-            console.error(`  ❌ Failed to generate prediction for ${player.web_name} (ID: ${playerId}):`, error instanceof Error ? error.message : 'Unknown error');
-            // Continue with other players even if one fails
-          }
+
+          transferredOutNeedingPredictions.push(player);
         }
-        
+
+        const minutesByTransferredOut = await minutesEstimator.estimateMinutesBulk(transferredOutNeedingPredictions);
+
+        for (let i = 0; i < transferredOutNeedingPredictions.length; i += GameweekAnalyzerService.PREDICTION_CONCURRENCY) {
+          const batch = transferredOutNeedingPredictions.slice(i, i + GameweekAnalyzerService.PREDICTION_CONCURRENCY);
+          await Promise.all(batch.map(async player => {
+            // Get upcoming fixtures for this player
+            const upcomingFixtures = (fixturesByTeam.get(player.team) ?? []).slice(0, 3);
+
+            try {
+              console.log(`  🎯 Generating prediction for transferred-out ${player.web_name} (ID: ${player.id})...`);
+
+              // Generate prediction using AI service
+              await aiPredictionService.predictPlayerPoints({
+                player,
+                upcomingFixtures,
+                userId,
+                gameweek,
+                snapshotId: inputData.context.snapshotId,
+                preloadedMinutes: minutesByTransferredOut.get(player.id),
+                preloadedTeams: inputData.context.snapshot.data.teams,
+              });
+
+              transferredOutPredictionsCreated++;
+              console.log(`  ✅ Prediction generated for ${player.web_name}`);
+            } catch (error) {
+              console.error(`  ❌ Failed to generate prediction for ${player.web_name} (ID: ${player.id}):`, error instanceof Error ? error.message : 'Unknown error');
+              // Continue with other players even if one fails
+            }
+          }));
+        }
+
         console.log(`\n[GameweekAnalyzer] 📊 Transferred-out prediction generation complete: ${transferredOutPredictionsCreated} generated, ${transferredOutIds.size - transferredOutPredictionsCreated} skipped`);
       }
 
       // Update predictionsMap with transferred-out players for transfer card display
       // Fetch latest predictions to include newly generated transferred-out predictions
-      const latestPredictions = await storage.getPredictionsByGameweek(userId, gameweek);
+      const latestPredictions = await storage.getPredictionsBySnapshot(
+        userId,
+        gameweek,
+        inputData.context.snapshotId
+      );
       const allRelevantPlayerIds = new Set([
         ...Array.from(currentPlayerIds), // Current squad (after transfers)
         ...Array.from(transferredOutIds), // Transferred-out players for transfer card display
       ]);
-      
-      const relevantPredictions = latestPredictions.filter(p => 
-        allRelevantPlayerIds.has(p.playerId) && 
-        p.snapshotId === inputData.context.snapshotId
-      );
+
+      const relevantPredictions = latestPredictions.filter(p => allRelevantPlayerIds.has(p.playerId));
 
       console.log(`[GameweekAnalyzer] Updating predictionsMap with ${relevantPredictions.length} predictions (current squad + transferred-out)`);
 
@@ -772,7 +811,7 @@ export class GameweekAnalyzerService {
       
       console.log(`[GameweekAnalyzer] 📊 Final predictionsMap contents before enhancement loop (${predictionsMap.size} players):`);
       const predictionsArray = Array.from(predictionsMap.entries()).map(([playerId, pts]) => {
-        const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === playerId);
+        const player = snapshotPlayersById.get(playerId);
         return { playerId, name: player?.web_name || 'Unknown', predictedPoints: pts };
       }).sort((a, b) => b.predictedPoints - a.predictedPoints);
       console.log(predictionsArray.slice(0, 15).map(p => `  ${p.name}: ${p.predictedPoints} pts`).join('\n'));
@@ -783,9 +822,9 @@ export class GameweekAnalyzerService {
         const playerOutPredicted = predictionsMap.get(transfer.player_out_id) || 0;
         const playerInPredicted = predictionsMap.get(transfer.player_in_id) || 0;
         
-        const playerOutName = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_out_id)?.web_name || `Player ${transfer.player_out_id}`;
-        const playerInName = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_in_id)?.web_name || `Player ${transfer.player_in_id}`;
-        
+        const playerOutName = snapshotPlayersById.get(transfer.player_out_id)?.web_name || `Player ${transfer.player_out_id}`;
+        const playerInName = snapshotPlayersById.get(transfer.player_in_id)?.web_name || `Player ${transfer.player_in_id}`;
+
         console.log(`  Transfer: ${playerOutName} (${playerOutPredicted} pts) → ${playerInName} (${playerInPredicted} pts)`);
       }
       
@@ -822,7 +861,13 @@ export class GameweekAnalyzerService {
       // Track all transferred-out player IDs to exclude from substitution detection
       // Defined outside the usingFallbackData check so it's available for auto-pick optimization
       const transferredOutPlayerIds = new Set(uniqueTransfers.map(t => t.player_out_id));
-      
+
+      // The analysis below computes several fields for the plan row (transfers,
+      // lineup optimizations, reasoning, lineup, predicted points). Stage them
+      // here and persist everything in a single UPDATE at the end instead of
+      // issuing one statement per field.
+      const planUpdates: GameweekPlanResultUpdates = {};
+
       if (uniqueTransfers.length > 0) {
         console.log(`\n[GameweekAnalyzer] 🔄 Processing ${uniqueTransfers.length} transfers...`);
         
@@ -842,12 +887,12 @@ export class GameweekAnalyzerService {
         const currentStartingXI = currentLineup.filter(p => p.position <= 11);
         const currentBench = currentLineup.filter(p => p.position > 11);
         console.log(`  Starting XI (${currentStartingXI.length}): ${currentStartingXI.map(p => {
-          const player = inputData.context.snapshot.data.players.find((pl: FPLPlayer) => pl.id === p.player_id);
+          const player = snapshotPlayersById.get(p.player_id);
           const prediction = predictionsMap.get(p.player_id) || 0;
           return `${player?.web_name}(${prediction}pts)`;
         }).join(', ')}`);
         console.log(`  Bench (${currentBench.length}): ${currentBench.map(p => {
-          const player = inputData.context.snapshot.data.players.find((pl: FPLPlayer) => pl.id === p.player_id);
+          const player = snapshotPlayersById.get(p.player_id);
           const prediction = predictionsMap.get(p.player_id) || 0;
           return `${player?.web_name}(${prediction}pts)`;
         }).join(', ')}`);
@@ -857,7 +902,7 @@ export class GameweekAnalyzerService {
         // Each transfer is analyzed against the state AFTER all previous transfers
         const cumulativeTransfers: typeof uniqueTransfers = [];
         console.log(`[GameweekAnalyzer] Transferred-out players (${transferredOutPlayerIds.size}): ${Array.from(transferredOutPlayerIds).map(id => {
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+          const player = snapshotPlayersById.get(id);
           return player?.web_name || id;
         }).join(', ')}`);
         
@@ -870,7 +915,7 @@ export class GameweekAnalyzerService {
           .map(p => p.player_id!);
         
         console.log(`[GameweekAnalyzer] Baseline starting XI from ORIGINAL FPL positions (${baselineStartingXI.length} players): ${baselineStartingXI.map(id => {
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+          const player = snapshotPlayersById.get(id);
           return player?.web_name || id;
         }).join(', ')}`);
         
@@ -878,8 +923,8 @@ export class GameweekAnalyzerService {
         // - Baseline lineup (with all previous transfers applied)
         // - Lineup after adding this transfer to the cumulative set
         for (const transfer of uniqueTransfers) {
-          const playerInName = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_in_id)?.web_name || `Player ${transfer.player_in_id}`;
-          const playerOutName = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_out_id)?.web_name || `Player ${transfer.player_out_id}`;
+          const playerInName = snapshotPlayersById.get(transfer.player_in_id)?.web_name || `Player ${transfer.player_in_id}`;
+          const playerOutName = snapshotPlayersById.get(transfer.player_out_id)?.web_name || `Player ${transfer.player_out_id}`;
           
           console.log(`\n[GameweekAnalyzer] 🔍 Analyzing transfer: ${playerOutName} (ID: ${transfer.player_out_id}) → ${playerInName} (ID: ${transfer.player_in_id})`);
           
@@ -912,12 +957,12 @@ export class GameweekAnalyzerService {
           const newStartingXI = lineupWithThisTransfer.filter(p => p.position <= 11);
           const newBench = lineupWithThisTransfer.filter(p => p.position > 11);
           console.log(`    Starting XI (${newStartingXI.length}): ${newStartingXI.map(p => {
-            const player = inputData.context.snapshot.data.players.find((pl: FPLPlayer) => pl.id === p.player_id);
+            const player = snapshotPlayersById.get(p.player_id);
             const prediction = predictionsMap.get(p.player_id) || 0;
             return `${player?.web_name}(${prediction}pts)`;
           }).join(', ')}`);
           console.log(`    Bench (${newBench.length}): ${newBench.map(p => {
-            const player = inputData.context.snapshot.data.players.find((pl: FPLPlayer) => pl.id === p.player_id);
+            const player = snapshotPlayersById.get(p.player_id);
             const prediction = predictionsMap.get(p.player_id) || 0;
             return `${player?.web_name}(${prediction}pts)`;
           }).join(', ')}`);
@@ -948,11 +993,11 @@ export class GameweekAnalyzerService {
             const newStartingXIIds = lineupWithThisTransfer.filter(p => p.position <= 11).map(p => p.player_id);
             
             console.log(`  Baseline starting XI (${baselineStartingXI.length} players): ${baselineStartingXI.map(id => {
-              const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+              const player = snapshotPlayersById.get(id);
               return player?.web_name || id;
             }).join(', ')}`);
             console.log(`  New starting XI with this transfer (${newStartingXIIds.length} players): ${newStartingXIIds.map(id => {
-              const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+              const player = snapshotPlayersById.get(id);
               return player?.web_name || id;
             }).join(', ')}`);
             
@@ -967,25 +1012,24 @@ export class GameweekAnalyzerService {
             );
             
             if (benchedPlayerId) {
-              const benchedPlayerName = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === benchedPlayerId)?.web_name || `Player ${benchedPlayerId}`;
+              const benchedPlayerName = snapshotPlayersById.get(benchedPlayerId)?.web_name || `Player ${benchedPlayerId}`;
               console.log(`  🎯 Found benched player: ${benchedPlayerName} (ID: ${benchedPlayerId})`);
             } else {
               console.log(`  ✅ NO additional benched player found - incoming player simply takes the transferred-out player's spot.`);
               console.log(`  Diagnosis: Baseline starting XI = ${baselineStartingXI.length}, New starting XI = ${newStartingXIIds.length}`);
               const playersOnlyInBaseline = baselineStartingXI.filter((id: number) => !newStartingXIIds.includes(id) && id !== transfer.player_out_id);
               const playersOnlyInNew = newStartingXIIds.filter((id: number) => !baselineStartingXI.includes(id));
-              console.log(`  Players only in baseline XI (excluding ${playerOutName}): ${playersOnlyInBaseline.map((id: number) => inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id)?.web_name || id).join(', ') || 'NONE'}`);
-              console.log(`  Players only in new XI: ${playersOnlyInNew.map((id: number) => inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id)?.web_name || id).join(', ') || 'NONE'}`);
+              console.log(`  Players only in baseline XI (excluding ${playerOutName}): ${playersOnlyInBaseline.map((id: number) => snapshotPlayersById.get(id)?.web_name || id).join(', ') || 'NONE'}`);
+              console.log(`  Players only in new XI: ${playersOnlyInNew.map((id: number) => snapshotPlayersById.get(id)?.web_name || id).join(', ') || 'NONE'}`);
             }
             
             if (benchedPlayerId) {
-              const benchedPlayer = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === benchedPlayerId);
-              const transferredInPlayer = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_in_id);
+              const benchedPlayer = snapshotPlayersById.get(benchedPlayerId);
+              const transferredInPlayer = snapshotPlayersById.get(transfer.player_in_id);
               
               if (benchedPlayer && transferredInPlayer) {
                 // POSITION VALIDATION: Check if substitution is valid according to FPL rules
                 // GK can only be replaced by GK, outfield players can swap with each other
-                const positionNames = ['', 'GK', 'DEF', 'MID', 'FWD'];
                 const benchedPlayerType = benchedPlayer.element_type; // 1=GK, 2=DEF, 3=MID, 4=FWD
                 const incomingPlayerType = transferredInPlayer.element_type;
                 
@@ -994,10 +1038,10 @@ export class GameweekAnalyzerService {
                   (benchedPlayerType > 1 && incomingPlayerType > 1);        // Outfield ↔ Outfield
                 
                 if (!isValidSubstitution) {
-                  console.log(`  ⚠️ INVALID SUBSTITUTION DETECTED: ${benchedPlayer.web_name} (${positionNames[benchedPlayerType]}) cannot be benched for ${transferredInPlayer.web_name} (${positionNames[incomingPlayerType]})`);
+                  console.log(`  ⚠️ INVALID SUBSTITUTION DETECTED: ${benchedPlayer.web_name} (${POSITION_NAMES[benchedPlayerType]}) cannot be benched for ${transferredInPlayer.web_name} (${POSITION_NAMES[incomingPlayerType]})`);
                   console.log(`  ⏭️  Skipping this substitution - violates FPL position rules`);
                 } else {
-                  console.log(`  ✅ Valid substitution: ${positionNames[benchedPlayerType]} ↔ ${positionNames[incomingPlayerType]}`);
+                  console.log(`  ✅ Valid substitution: ${POSITION_NAMES[benchedPlayerType]} ↔ ${POSITION_NAMES[incomingPlayerType]}`);
                   
                   // Get predicted points for comparison
                   const benchedPrediction = predictionsMap.get(benchedPlayerId) || 0;
@@ -1061,8 +1105,8 @@ export class GameweekAnalyzerService {
                   }
                   
                   // Get position name for the benched player
-                  const benchedPlayerPosition = positionNames[benchedPlayer.element_type] || 'Unknown';
-                  const transferredInPlayerPosition = positionNames[transferredInPlayer.element_type] || 'Unknown';
+                  const benchedPlayerPosition = POSITION_NAMES[benchedPlayer.element_type] || 'Unknown';
+                  const transferredInPlayerPosition = POSITION_NAMES[transferredInPlayer.element_type] || 'Unknown';
                   
                   // Build the bench reason message
                   const benchReason = reasons.length > 0 
@@ -1114,11 +1158,11 @@ export class GameweekAnalyzerService {
         const finalStartingXI = lineup.filter(p => p.position <= 11).map(p => p.player_id);
         
         console.log(`  Original starting XI (${originalStartingXI.length}): ${originalStartingXI.map(id => {
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+          const player = snapshotPlayersById.get(id);
           return player?.web_name || id;
         }).join(', ')}`);
         console.log(`  Final starting XI (${finalStartingXI.length}): ${finalStartingXI.map(id => {
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+          const player = snapshotPlayersById.get(id);
           return player?.web_name || id;
         }).join(', ')}`);
         
@@ -1131,11 +1175,11 @@ export class GameweekAnalyzerService {
         );
         
         console.log(`  Players benched by auto-pick: ${benchedByAutoPick.map(id => {
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+          const player = snapshotPlayersById.get(id);
           return player?.web_name || id;
         }).join(', ') || 'NONE'}`);
         console.log(`  Players starting by auto-pick: ${startingByAutoPick.map(id => {
-          const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === id);
+          const player = snapshotPlayersById.get(id);
           return player?.web_name || id;
         }).join(', ') || 'NONE'}`);
         
@@ -1150,7 +1194,7 @@ export class GameweekAnalyzerService {
           
           // Pair benched players with starting players by position (one-to-one mapping)
           for (const benchedPlayerId of benchedByAutoPick) {
-            const benchedPlayer = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === benchedPlayerId);
+            const benchedPlayer = snapshotPlayersById.get(benchedPlayerId);
             if (!benchedPlayer) {
               console.log(`  ⚠️ Skipping benched player ID ${benchedPlayerId} - not found in snapshot`);
               continue;
@@ -1158,7 +1202,7 @@ export class GameweekAnalyzerService {
             
             // Find matching starting player by position from AVAILABLE players only
             const matchingStartingPlayerId = availableStartingPlayers.find(startingId => {
-              const startingPlayer = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === startingId);
+              const startingPlayer = snapshotPlayersById.get(startingId);
               if (!startingPlayer) return false;
               
               // GK can only match with GK, outfield can match with outfield
@@ -1171,14 +1215,13 @@ export class GameweekAnalyzerService {
               continue;
             }
             
-            const startingPlayer = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === matchingStartingPlayerId);
+            const startingPlayer = snapshotPlayersById.get(matchingStartingPlayerId);
             if (!startingPlayer) {
               console.log(`  ⚠️ Starting player ID ${matchingStartingPlayerId} not found in snapshot`);
               continue;
             }
             
-            const positionNames = ['', 'GK', 'DEF', 'MID', 'FWD'];
-            console.log(`  🔄 Auto-pick change: ${benchedPlayer.web_name} (${positionNames[benchedPlayer.element_type]}) → ${startingPlayer.web_name} (${positionNames[startingPlayer.element_type]})`);
+            console.log(`  🔄 Auto-pick change: ${benchedPlayer.web_name} (${POSITION_NAMES[benchedPlayer.element_type]}) → ${startingPlayer.web_name} (${POSITION_NAMES[startingPlayer.element_type]})`);
             
             // Create a pseudo-transfer to hold this substitution info
             const benchedPrediction = predictionsMap.get(benchedPlayerId) || 0;
@@ -1223,11 +1266,11 @@ export class GameweekAnalyzerService {
             (aiResponse as any).lineupOptimizations.push({
               benched_player_id: benchedPlayerId,
               benched_player_name: benchedPlayer.web_name,
-              benched_player_position: positionNames[benchedPlayer.element_type],
+              benched_player_position: POSITION_NAMES[benchedPlayer.element_type],
               benched_player_predicted_points: benchedPrediction,
               starting_player_id: matchingStartingPlayerId,
               starting_player_name: startingPlayer.web_name,
-              starting_player_position: positionNames[startingPlayer.element_type],
+              starting_player_position: POSITION_NAMES[startingPlayer.element_type],
               starting_player_predicted_points: startingPrediction,
               reasoning: benchReason,
               accepted: true, // Default accepted for new recommendations
@@ -1267,8 +1310,8 @@ export class GameweekAnalyzerService {
         // CRITICAL FIX: Filter out bad transfers where player IN is predicted lower than player OUT
         // This prevents recommending players with rotation/injury risk for short-term loss
         const enrichedTransfers = enrichedTransfersRaw.filter(transfer => {
-          const playerIn = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_in_id);
-          const playerOut = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === transfer.player_out_id);
+          const playerIn = snapshotPlayersById.get(transfer.player_in_id);
+          const playerOut = snapshotPlayersById.get(transfer.player_out_id);
           
           // Rule 1: Reject if incoming player is predicted LOWER than outgoing for THIS gameweek
           if (transfer.player_in_predicted_points < transfer.player_out_predicted_points) {
@@ -1347,13 +1390,13 @@ export class GameweekAnalyzerService {
         
         // Save enriched transfers WITH substitution_details (for transfer card display)
         // IMPORTANT: Keep substitution_details on transfers so frontend can show lineup impact
-        await storage.updateGameweekPlanTransfers(plan.id, enrichedTransfers);
-        console.log(`[GameweekAnalyzer] Transfer recommendations (with individual predictions) saved to database for plan ${plan.id}`);
+        planUpdates.transfers = enrichedTransfers;
+        console.log(`[GameweekAnalyzer] Transfer recommendations (with individual predictions) staged for plan ${plan.id}`);
         
         // Save lineup optimizations if any were created
         if ((aiResponse as any).lineupOptimizations && (aiResponse as any).lineupOptimizations.length > 0) {
-          await storage.updateGameweekPlanLineupOptimizations(plan.id, (aiResponse as any).lineupOptimizations);
-          console.log(`[GameweekAnalyzer] Lineup optimizations saved to database for plan ${plan.id}`);
+          planUpdates.lineupOptimizations = (aiResponse as any).lineupOptimizations;
+          console.log(`[GameweekAnalyzer] Lineup optimizations staged for plan ${plan.id}`);
           
           // CRITICAL: Update aiReasoning to include lineup optimization summaries in the overall explanation
           // This ensures the user sees all changes (transfers + lineup changes) in one unified narrative
@@ -1365,7 +1408,7 @@ export class GameweekAnalyzerService {
           if (lineupOptSummaries) {
             // Append lineup optimization summary to the existing reasoning
             const updatedReasoning = correctedReasoning + `\n\n**Lineup Optimizations:** ${lineupOptSummaries}`;
-            await storage.updateGameweekPlanReasoning(plan.id, updatedReasoning);
+            planUpdates.reasoning = updatedReasoning;
             console.log(`[GameweekAnalyzer] Updated aiReasoning with ${(aiResponse as any).lineupOptimizations.length} lineup optimization summary(ies)`);
           }
         }
@@ -1393,11 +1436,11 @@ export class GameweekAnalyzerService {
           if (prediction !== undefined) {
             const points = prediction * pick.multiplier; // Apply multiplier (captain 2x, triple captain 3x, bench boost 1x)
             calculatedGrossPoints += points;
-            const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === pick.player_id);
+            const player = snapshotPlayersById.get(pick.player_id);
             const posLabel = pick.position <= 11 ? 'XI' : 'Bench';
             console.log(`  [${posLabel}] ${player?.web_name}: ${prediction} pts × ${pick.multiplier} = ${points}`);
           } else {
-            const player = inputData.context.snapshot.data.players.find((p: FPLPlayer) => p.id === pick.player_id);
+            const player = snapshotPlayersById.get(pick.player_id);
             const playerName = player?.web_name || `Player ${pick.player_id}`;
             missingPredictionCount++;
             missingPlayers.push(playerName);
@@ -1473,15 +1516,15 @@ export class GameweekAnalyzerService {
         const updatedReasoning = correctExplanation + '\n\n' + cleanedReasoning;
         aiResponse.reasoning = updatedReasoning;
         
-        // Update the stored reasoning in the database
-        await storage.updateGameweekPlanReasoning(plan.id, updatedReasoning);
+        // Replaces any reasoning staged earlier - this version is final
+        planUpdates.reasoning = updatedReasoning;
         console.log(`[GameweekAnalyzer] ✅ Replaced AI transfer explanation with calculated GROSS: ${grossPoints} → NET: ${netPoints}`);
       } else if (transferCost > 0 && !predictionReliable) {
         console.warn(`[GameweekAnalyzer] ⚠️  Cannot add transfer cost explanation - predictions incomplete, cannot verify GROSS value`);
       }
 
       // Update the plan with the lineup
-      await storage.updateGameweekPlanLineup(plan.id, lineup);
+      planUpdates.lineup = lineup;
       plan.lineup = lineup as any; // Update local object
       
       // Update predicted points with calculated/verified GROSS value
@@ -1495,9 +1538,13 @@ export class GameweekAnalyzerService {
       console.log(`  Correct NET: ${correctNetPoints}`);
       
       // Update both predicted points (NET) and baseline (GROSS) with deterministic calculations
-      await storage.updateGameweekPlanPredictions(plan.id, correctNetPoints, Math.round(finalGrossPoints));
+      planUpdates.predictedPoints = correctNetPoints;
+      planUpdates.baselinePredictedPoints = Math.round(finalGrossPoints);
       plan.predictedPoints = correctNetPoints; // Update local object
 
+      // Flush all staged plan fields in one UPDATE
+      await storage.updateGameweekPlanResults(plan.id, planUpdates);
+
       console.log(`[GameweekAnalyzer] Analysis complete, plan ID: ${plan.id}`);
 
       // Log the decision to audit trail
@@ -1518,6 +1565,31 @@ export class GameweekAnalyzerService {
     }
   }
 
+  // Index upcoming fixtures under both teams so per-player lookups are a Map
+  // get instead of a scan over the whole fixture list. Built once per
+  // prediction batch; order (and therefore the first-3 slice) matches the
+  // original filter.
+  private indexUpcomingFixturesByTeam(fixtures: FPLFixture[], gameweek: number): Map<number, FPLFixture[]> {
+    const fixturesByTeam = new Map<number, FPLFixture[]>();
+
+    const record = (teamId: number, fixture: FPLFixture) => {
+      const teamFixtures = fixturesByTeam.get(teamId);
+      if (teamFixtures) {
+        teamFixtures.push(fixture);
+      } else {
+        fixturesByTeam.set(teamId, [fixture]);
+      }
+    };
+
+    for (const fixture of fixtures) {
+      if (fixture.finished || !fixture.event || fixture.event < gameweek) continue;
+      record(fixture.team_h, fixture);
+      record(fixture.team_a, fixture);
+    }
+
+    return fixturesByTeam;
+  }
+
   private async collectInputData(userId: number, gameweek: number) {
     console.log(`[GameweekAnalyzer] Collecting input data...`);
 
@@ -1655,7 +1727,10 @@ export class GameweekAnalyzerService {
     // APPROACH: First ensure we have a base team with accurate bank/value,
     // THEN overlay applied lineup positions if available
     
-    let team = await storage.getTeam(userId, gameweek);
+    // Eager-load this gameweek and the previous one together - the fallback
+    // below would otherwise trigger a second roundtrip when this GW is missing
+    const candidateTeams = await storage.getTeamsByGameweeks(userId, [gameweek, gameweek - 1]);
+    let team = candidateTeams.find(t => t.gameweek === gameweek);
     let lineupFromFallback = false;
 
     // CRITICAL: Check if gameweek deadline has passed
@@ -1674,7 +1749,7 @@ export class GameweekAnalyzerService {
     // Step 1: Ensure we have a base team with accurate bank/value
     if (!team) {
       // Try previous gameweek from DB (FALLBACK - lineup may be stale)
-      team = await storage.getTeam(userId, gameweek - 1);
+      team = candidateTeams.find(t => t.gameweek === gameweek - 1);
       if (team) {
         console.log(`[GameweekAnalyzer] ⚠️ Using GW${gameweek - 1} team data as fallback for GW${gameweek}`);
         lineupFromFallback = true;
@@ -1805,13 +1880,18 @@ export class GameweekAnalyzerService {
 
   private async generateAIRecommendations(userId: number, inputData: any, gameweek: number, targetPlayerId?: number, previousPlan?: GameweekPlan | null, customLineup?: CustomLineupPlayer[]): Promise<AIGameweekResponse> {
     const { currentTeam, allPlayers, teams, upcomingFixtures, userSettings, chipsUsed, freeTransfers, budget, setPieceTakers, dreamTeam, leagueInsights, leagueProjectionData } = inputData;
-    
+
+    // Prompt assembly resolves players and teams by id dozens of times while
+    // formatting names; index both lists once instead of scanning per reference
+    const allPlayersById = new Map<number, FPLPlayer>(allPlayers.map((p: FPLPlayer) => [p.id, p]));
+    const teamsById = new Map<number, FPLTeam>(teams.map((t: FPLTeam) => [t.id, t]));
+
     // Get target player details if specified
     let targetPlayerInfo = '';
     if (targetPlayerId) {
-      const targetPlayer = allPlayers.find((p: FPLPlayer) => p.id === targetPlayerId);
+      const targetPlayer = allPlayersById.get(targetPlayerId);
       if (targetPlayer) {
-        const team = teams.find((t: FPLTeam) => t.id === targetPlayer.team);
+        const team = teamsById.get(targetPlayer.team);
         targetPlayerInfo = `\n\n🎯 SPECIAL REQUEST: GET ${targetPlayer.web_name.toUpperCase()} INTO THE TEAM
 Target Player: ID:${targetPlayer.id} ${targetPlayer.web_name} (${team?.short_name})
 Position: ${targetPlayer.element_type === 1 ? 'GK' : targetPlayer.element_type === 2 ? 'DEF' : targetPlayer.element_type === 3 ? 'MID' : 'FWD'}
@@ -1847,20 +1927,18 @@ Form: ${targetPlayer.form} | PPG: ${targetPlayer.points_per_game} | Total: ${tar
       const filledPlayers = customLineup.filter(p => p.player_id);
       const positionCounts: { [key: number]: number } = { 1: 0, 2: 0, 3: 0, 4: 0 };
       for (const pick of filledPlayers) {
-        const player = allPlayers.find((p: FPLPlayer) => p.id === pick.player_id);
+        const player = allPlayersById.get(pick.player_id);
         if (player) {
           positionCounts[player.element_type] = (positionCounts[player.element_type] || 0) + 1;
         }
       }
       
       const missingPositions: string[] = [];
-      const positionNames = { 1: 'Goalkeeper', 2: 'Defender', 3: 'Midfielder', 4: 'Forward' };
-      const requiredCounts = { 1: 2, 2: 5, 3: 5, 4: 3 };
-      for (const [pos, required] of Object.entries(requiredCounts)) {
+      for (const [pos, required] of Object.entries(SQUAD_REQUIRED_COUNTS)) {
         const current = positionCounts[parseInt(pos)] || 0;
         const needed = required - current;
         if (needed > 0) {
-          missingPositions.push(`${needed} ${positionNames[parseInt(pos) as keyof typeof positionNames]}${needed > 1 ? 's' : ''}`);
+          missingPositions.push(`${needed} ${POSITION_FULL_NAMES[parseInt(pos)]}${needed > 1 ? 's' : ''}`);
         }
       }
       
@@ -1872,7 +1950,7 @@ Form: ${targetPlayer.form} | PPG: ${targetPlayer.points_per_game} | Total: ${tar
         if (!pick.player_id) {
           return `⚠️ EMPTY SLOT - NEEDS PLAYER`;
         }
-        const player = allPlayers.find((p: FPLPlayer) => p.id === pick.player_id);
+        const player = allPlayersById.get(pick.player_id);
         const role = pick.is_captain ? ' (C)' : pick.is_vice_captain ? ' (VC)' : '';
         return `${player?.web_name || `Unknown (ID:${pick.player_id})`}${role}`;
       };
@@ -1927,14 +2005,14 @@ ${customBench.map(p => `  - Position ${p.position}: ${formatLineupPlayer(p)}`).j
     if (previousPlan) {
       console.log(`[GameweekAnalyzer] Building previous plan context for continuity awareness`);
       
-      const prevCaptain = allPlayers.find((p: FPLPlayer) => p.id === previousPlan.captainId);
-      const prevViceCaptain = allPlayers.find((p: FPLPlayer) => p.id === previousPlan.viceCaptainId);
+      const prevCaptain = previousPlan.captainId != null ? allPlayersById.get(previousPlan.captainId) : undefined;
+      const prevViceCaptain = previousPlan.viceCaptainId != null ? allPlayersById.get(previousPlan.viceCaptainId) : undefined;
       
       let prevTransfersText = 'None (keep current squad)';
       if (previousPlan.transfers && Array.isArray(previousPlan.transfers) && previousPlan.transfers.length > 0) {
         prevTransfersText = previousPlan.transfers.map((t: any) => {
-          const pOut = allPlayers.find((p: FPLPlayer) => p.id === t.player_out_id);
-          const pIn = allPlayers.find((p: FPLPlayer) => p.id === t.player_in_id);
+          const pOut = allPlayersById.get(t.player_out_id);
+          const pIn = allPlayersById.get(t.player_in_id);
           return `  - OUT: ${pOut?.web_name || 'Unknown'} (ID:${t.player_out_id}) → IN: ${pIn?.web_name || 'Unknown'} (ID:${t.player_in_id}) [${t.priority} priority, +${t.expected_points_gain} pts]`;
         }).join('\n');
       }
@@ -1942,8 +2020,8 @@ ${customBench.map(p => `  - Position ${p.position}: ${formatLineupPlayer(p)}`).j
       let prevLineupOptimizationsText = 'None (keep current lineup)';
       if (previousPlan.lineupOptimizations && Array.isArray(previousPlan.lineupOptimizations) && previousPlan.lineupOptimizations.length > 0) {
         prevLineupOptimizationsText = previousPlan.lineupOptimizations.map((opt: any) => {
-          const benched = allPlayers.find((p: FPLPlayer) => p.id === opt.benched_player_id);
-          const starting = allPlayers.find((p: FPLPlayer) => p.id === opt.starting_player_id);
+          const benched = allPlayersById.get(opt.benched_player_id);
+          const starting = allPlayersById.get(opt.starting_player_id);
           return `  - BENCH: ${benched?.web_name || 'Unknown'} (ID:${opt.benched_player_id}, ${opt.benched_player_predicted_points} pts) → START: ${starting?.web_name || 'Unknown'} (ID:${opt.starting_player_id}, ${opt.starting_player_predicted_points} pts)`;
         }).join('\n');
       }
@@ -2024,8 +2102,8 @@ If significant changes occurred → Explain EXACTLY what changed (with specific
     // Get current squad details WITH PLAYER IDS
     const squadDetails = currentTeam.players
       .map((pick: any) => {
-        const player = allPlayers.find((p: FPLPlayer) => p.id === pick.player_id);
-        const team = teams.find((t: FPLTeam) => t.id === player?.team);
+        const player = allPlayersById.get(pick.player_id);
+        const team = player ? teamsById.get(player.team) : undefined;
         
         if (!player) return null;
 
@@ -2034,7 +2112,7 @@ If significant changes occurred → Explain EXACTLY what changed (with specific
           .slice(0, 6)
           .map((f: FPLFixture) => {
             const isHome = f.team_h === player.team;
-            const opponent = teams.find((t: FPLTeam) => t.id === (isHome ? f.team_a : f.team_h));
+            const opponent = teamsById.get(isHome ? f.team_a : f.team_h);
             const difficulty = isHome ? f.team_h_difficulty : f.team_a_difficulty;
             return `GW${f.event}: ${isHome ? 'H' : 'A'} vs ${opponent?.short_name} (Diff: ${difficulty})`;
           });
@@ -2077,7 +2155,7 @@ If significant changes occurred → Explain EXACTLY what changed (with specific
     // Calculate team counts to identify blocked teams (already have 3 players)
     const teamCounts: { [teamId: number]: { count: number; teamName: string; players: string[] } } = {};
     squadDetails.forEach((p: any) => {
-      const player = allPlayers.find((pl: FPLPlayer) => pl.id === p.id);
+      const player = allPlayersById.get(p.id);
       if (player) {
         const teamId = player.team;
         if (!teamCounts[teamId]) {
@@ -2096,7 +2174,7 @@ If significant changes occurred → Explain EXACTLY what changed (with specific
         // Find the actual players from this team with their selling prices
         const playersWithPrices = squadDetails
           .filter((p: any) => {
-            const player = allPlayers.find((pl: FPLPlayer) => pl.id === p.id);
+            const player = allPlayersById.get(p.id);
             return player && player.team === parseInt(teamId);
           })
           .map((p: any) => ({
@@ -2183,9 +2261,9 @@ ${blockedTeams.map(t => `⛔ ${t.teamName}: ${t.count} players (${t.players.join
     const benchPlayers = currentTeam.players
       .filter((pick: any) => pick.position >= 12)
       .map((pick: any) => {
-        const player = allPlayers.find((p: FPLPlayer) => p.id === pick.player_id);
+        const player = allPlayersById.get(pick.player_id);
         if (!player) return null;
-        const team = teams.find((t: FPLTeam) => t.id === player.team);
+        const team = teamsById.get(player.team);
         const sellingPrice = pick.selling_price ? pick.selling_price / 10 : player.now_cost / 10;
         const isInjuredOrUnavailable = player.status === 'i' || player.status === 'u' || player.status === 's' || 
           player.chance_of_playing_this_round === 0;
@@ -2209,7 +2287,7 @@ ${blockedTeams.map(t => `⛔ ${t.teamName}: ${t.count} players (${t.players.join
 
     const topPlayersInfo = Object.entries(topPlayersByPosition).map(([position, players]) => {
       const playerList = players.map((p: FPLPlayer) => {
-        const team = teams.find((t: FPLTeam) => t.id === p.team);
+        const team = teamsById.get(p.team);
         const suspensionRisk = calculateSuspensionRisk(p.yellow_cards, gameweek);
         const riskWarning = suspensionRisk.risk === 'critical' || suspensionRisk.risk === 'high' 
           ? ` ⚠️${suspensionRisk.description}` 
@@ -2249,7 +2327,7 @@ ${blockedTeams.map(t => `⛔ ${t.teamName}: ${t.count} players (${t.players.join
     if (dreamTeam?.team) {
       dreamTeamInfo = `\n\nLAST GAMEWEEK DREAM TEAM (Top Performers):\n`;
       dreamTeamInfo += dreamTeam.team.map((p: any) => {
-        const player = allPlayers.find((pl: FPLPlayer) => pl.id === p.element);
+        const player = allPlayersById.get(p.element);
         return `${player?.web_name || 'Unknown'} (${p.points} pts)`;
       }).join(', ');
     }
@@ -2451,7 +2529,7 @@ ${teams.map((t: FPLTeam) => {
     .slice(0, 6)
     .map((f: FPLFixture) => {
       const isHome = f.team_h === t.id;
-      const opponent = teams.find((team: FPLTeam) => team.id === (isHome ? f.team_a : f.team_h));
+      const opponent = teamsById.get(isHome ? f.team_a : f.team_h);
       const difficulty = isHome ? f.team_h_difficulty : f.team_a_difficulty;
       return `GW${f.event}:${difficulty}`;
     });
@@ -2898,7 +2976,7 @@ CRITICAL REQUIREMENTS:
             const reasoning = transfer.reasoning || '';
             // Try to find squad player mentioned in reasoning
             for (const pick of currentTeam.players) {
-              const player = allPlayers.find((p: FPLPlayer) => p.id === pick.player_id);
+              const player = allPlayersById.get(pick.player_id);
               if (player && reasoning.includes(player.web_name)) {
                 transfer.player_out_id = player.id;
                 console.log(`[GameweekAnalyzer] Fixed player_out_id to ${player.id} (${player.web_name})`);
@@ -2943,7 +3021,7 @@ CRITICAL REQUIREMENTS:
         const preFilterCount = result.transfers.length;
         result.transfers = result.transfers.filter((transfer: any) => {
           if (currentSquadPlayerIds.has(transfer.player_in_id)) {
-            const playerIn = allPlayers.find((p: FPLPlayer) => p.id === transfer.player_in_id);
+            const playerIn = allPlayersById.get(transfer.player_in_id);
             const playerInName = playerIn?.web_name || `ID ${transfer.player_in_id}`;
             console.log(`[GameweekAnalyzer] ⚠️ Filtered out transfer: ${playerInName} already in squad`);
             return false;
@@ -2982,8 +3060,8 @@ CRITICAL REQUIREMENTS:
         
         for (const transfer of result.transfers) {
           const outPick = currentTeam.players.find((p: any) => p.player_id === transfer.player_out_id);
-          const outPlayer = allPlayers.find((p: FPLPlayer) => p.id === transfer.player_out_id);
-          const inPlayer = allPlayers.find((p: FPLPlayer) => p.id === transfer.player_in_id);
+          const outPlayer = allPlayersById.get(transfer.player_out_id);
+          const inPlayer = allPlayersById.get(transfer.player_in_id);
           
           const sellingPrice = outPick?.selling_price || outPlayer?.now_cost || 0;
           const purchasePrice = inPlayer?.now_cost || 0;
@@ -74,6 +74,7 @@ export interface GameweekSnapshot {
 
 class GameweekDataSnapshotService {
   private cache: Map<number, GameweekSnapshot> = new Map();
+  private inFlightBuilds: Map<number, Promise<GameweekSnapshot>> = new Map();
   private readonly CACHE_DURATION = 5 * 60 * 1000; // 5 minutes - matches FPL API cache
 
   /**
@@ -127,7 +128,38 @@ class GameweekDataSnapshotService {
     } else {
       console.log(`[Snapshot] 🆕 CACHE MISS for GW${gameweek} (no cached data)`);
     }
-    
+
+    // Building a snapshot is expensive (FPL fetches + Understat enrichment +
+    // precomputation trigger). Share one in-flight build per gameweek so
+    // concurrent cold-cache callers don't each rebuild it - same pattern as
+    // the Understat in-flight request dedup.
+    if (!forceRefresh) {
+      const inFlight = this.inFlightBuilds.get(gameweek);
+      if (inFlight) {
+        console.log(`[Snapshot] Sharing in-flight build for GW${gameweek}`);
+        return inFlight;
+      }
+    }
+
+    const buildPromise = this.buildSnapshot(gameweek, enrichWithUnderstat);
+    this.inFlightBuilds.set(gameweek, buildPromise);
+
+    try {
+      return await buildPromise;
+    } finally {
+      this.inFlightBuilds.delete(gameweek);
+    }
+  }
+
+  /**
+   * Build a fresh snapshot for a gameweek (always bypasses cache)
+   */
+  private async buildSnapshot(
+    gameweek: number,
+    enrichWithUnderstat: boolean
+  ): Promise<GameweekSnapshot> {
+    const now = Date.now();
+
     // Fetch all FPL data in parallel
     const [players, teams, fixtures, gameweeks, element_types] = await Promise.all([
       fplApi.getPlayers(),
@@ -216,11 +248,14 @@ class GameweekDataSnapshotService {
       }
     }
 
-    // Merge Understat data back into players
-    return players.map((player) => ({
-      ...player,
-      understat: enrichedMap.get(player.id) || null,
-    }));
+    // Merge Understat data back into players. Only the premium players that
+    // were actually enriched get cloned; everyone else keeps their original
+    // object, so a refresh doesn't duplicate the full ~700-player array just
+    // to attach an explicit null.
+    return players.map((player) => {
+      const understat = enrichedMap.get(player.id);
+      return understat !== undefined ? { ...player, understat } : player;
+    });
   }
 
   /**
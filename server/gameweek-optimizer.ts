@@ -1,4 +1,5 @@
 import { statisticalPredictor } from "./statistical-predictor";
+import { minutesEstimator } from "./minutes-estimator";
 import type { FPLPlayer, FPLFixture, FPLTeam } from "@shared/schema";
 
 interface BenchOptimization {
@@ -30,18 +31,43 @@ interface GameweekPlan {
 }
 
 export class GameweekOptimizer {
+  // Index the gameweek's unfinished fixtures by team once, so per-player
+  // lookups are O(1) instead of a scan over the full fixture list
+  private indexFixturesByTeam(fixtures: FPLFixture[], gameweek: number): Map<number, FPLFixture[]> {
+    const byTeam = new Map<number, FPLFixture[]>();
+    for (const fixture of fixtures) {
+      if (fixture.finished || fixture.event !== gameweek) continue;
+      for (const teamId of [fixture.team_h, fixture.team_a]) {
+        const list = byTeam.get(teamId);
+        if (list) {
+          list.push(fixture);
+        } else {
+          byTeam.set(teamId, [fixture]);
+        }
+      }
+    }
+    return byTeam;
+  }
+
   async optimizeBench(
     squad: FPLPlayer[],
     fixtures: FPLFixture[],
     teams: FPLTeam[],
     gameweek: number
   ): Promise<BenchOptimization> {
+    const fixturesByTeam = this.indexFixturesByTeam(fixtures, gameweek);
+    // Estimate minutes for the whole squad in one bulk query so the
+    // per-player predictions below don't each hit the minutes-history table
+    const minutesBySquadPlayer = await minutesEstimator.estimateMinutesBulk(squad);
     const predictions = await Promise.all(
       squad.map(async player => {
-        const upcomingFixture = fixtures.filter(
-          f => !f.finished && f.event === gameweek && (f.team_h === player.team || f.team_a === player.team)
+        const upcomingFixture = fixturesByTeam.get(player.team) ?? [];
+        const prediction = await statisticalPredictor.predictPlayerPointsStatistical(
+          player,
+          upcomingFixture,
+          teams,
+          minutesBySquadPlayer.get(player.id)
         );
-        const prediction = await statisticalPredictor.predictPlayerPointsStatistical(player, upcomingFixture, teams);
         return { player, prediction: prediction.predicted_points };
       })
     );
@@ -75,19 +101,27 @@ export class GameweekOptimizer {
     starting11.push(...forwards.slice(0, 2).map(p => p.player));
     bench.push(...forwards.slice(2).map(p => p.player));
 
-    while (starting11.length < 11) {
-      const remaining = predictions.filter(
-        p => !starting11.includes(p.player) && !bench.includes(p.player)
-      );
-      if (remaining.length === 0) break;
-      remaining.sort((a, b) => b.prediction - a.prediction);
-      starting11.push(remaining[0].player);
+    // Fill the remaining XI slots from one descending sort instead of
+    // re-filtering and re-sorting the whole pool for every slot
+    if (starting11.length < 11) {
+      const selectedIds = new Set<number>([
+        ...starting11.map(p => p.id),
+        ...bench.map(p => p.id),
+      ]);
+      const bestRemaining = [...predictions].sort((a, b) => b.prediction - a.prediction);
+      for (const candidate of bestRemaining) {
+        if (starting11.length >= 11) break;
+        if (selectedIds.has(candidate.player.id)) continue;
+        starting11.push(candidate.player);
+        selectedIds.add(candidate.player.id);
+      }
     }
 
-    const expectedBenchPoints = bench.reduce((sum, player) => {
-      const pred = predictions.find(p => p.player.id === player.id);
-      return sum + (pred?.prediction || 0);
-    }, 0);
+    const predictionByPlayerId = new Map(predictions.map(p => [p.player.id, p.prediction]));
+    const expectedBenchPoints = bench.reduce(
+      (sum, player) => sum + (predictionByPlayerId.get(player.id) || 0),
+      0
+    );
 
     const reasoning = `Optimized bench based on predicted points. Expected bench points: ${expectedBenchPoints.toFixed(1)}. Consider Bench Boost if expecting ${(expectedBenchPoints / 4).toFixed(1)}+ points per bench player.`;
 
@@ -244,12 +278,17 @@ export class GameweekOptimizer {
   ): Promise<GameweekPlan> {
     const benchOptimization = await this.optimizeBench(squad, fixtures, teams, gameweek);
 
+    const fixturesByTeam = this.indexFixturesByTeam(fixtures, gameweek);
+    const minutesByStarter = await minutesEstimator.estimateMinutesBulk(benchOptimization.starting11);
     const predictions = await Promise.all(
       benchOptimization.starting11.map(async player => {
-        const upcomingFixture = fixtures.filter(
-          f => !f.finished && f.event === gameweek && (f.team_h === player.team || f.team_a === player.team)
+        const upcomingFixture = fixturesByTeam.get(player.team) ?? [];
+        const prediction = await statisticalPredictor.predictPlayerPointsStatistical(
+          player,
+          upcomingFixture,
+          teams,
+          minutesByStarter.get(player.id)
         );
-        const prediction = await statisticalPredictor.predictPlayerPointsStatistical(player, upcomingFixture, teams);
         return { player, prediction: prediction.predicted_points };
       })
     );
@@ -1,5 +1,16 @@
 import type { FPLPlayer, FPLFixture, FPLTeam } from "@shared/schema";
 
+// Fixture-difficulty coefficients hoisted to module scope so the captaincy
+// loop does a table lookup instead of re-evaluating a ternary chain per
+// candidate (same scale as the enhanced-predictions multipliers)
+const DIFFICULTY_MULTIPLIERS: Record<number, number> = {
+  1: 1.3,
+  2: 1.15,
+  3: 1.0,
+  4: 0.85,
+  5: 0.7,
+};
+
 interface DifferentialPlayer {
   player: FPLPlayer;
   ownership: number;
@@ -23,13 +34,47 @@ interface CaptaincySwing {
   risk: "low" | "medium" | "high";
 }
 
+interface WeeklyInsights {
+  differentials: DifferentialPlayer[];
+  template: TemplatePlayer[];
+  captaincySwings: CaptaincySwing[];
+}
+
 export class InsightsGenerator {
+  // Weekly insights are recomputed over the full player list on every request
+  // even though the inputs only change when the snapshot refreshes. Cache the
+  // assembled response per gameweek with a short TTL so dashboard polling
+  // reuses one computation per minute.
+  private weeklyInsightsCache = new Map<number, { insights: WeeklyInsights; cachedAt: number }>();
+  private readonly WEEKLY_INSIGHTS_TTL = 60 * 1000;
+
+  // Index unfinished fixtures under both participating teams once, so
+  // per-player lookups don't each rescan the full fixture list
+  private indexUpcomingFixturesByTeam(fixtures: FPLFixture[]): Map<number, FPLFixture[]> {
+    const byTeam = new Map<number, FPLFixture[]>();
+    for (const fixture of fixtures) {
+      if (fixture.finished || !fixture.event) continue;
+      for (const teamId of [fixture.team_h, fixture.team_a]) {
+        const list = byTeam.get(teamId);
+        if (list) {
+          list.push(fixture);
+        } else {
+          byTeam.set(teamId, [fixture]);
+        }
+      }
+    }
+    return byTeam;
+  }
+
   async findDifferentials(
     allPlayers: FPLPlayer[],
     fixtures: FPLFixture[],
     teams: FPLTeam[],
     maxOwnership: number = 10
   ): Promise<DifferentialPlayer[]> {
+    const fixturesByTeam = this.indexUpcomingFixturesByTeam(fixtures);
+    const teamsById = new Map(teams.map(t => [t.id, t]));
+
     const differentials = allPlayers
       .filter(p => {
         const ownership = parseFloat(p.selected_by_percent);
@@ -43,26 +88,20 @@ export class InsightsGenerator {
         );
       })
       .map(p => {
-        const team = teams.find(t => t.id === p.team);
-        const upcomingFixtures = fixtures
-          .filter(f => !f.finished && f.event && (f.team_h === p.team || f.team_a === p.team))
-          .slice(0, 3)
-          .map(f => {
-            const isHome = f.team_h === p.team;
-            const opponent = teams.find(t => t.id === (isHome ? f.team_a : f.team_h));
-            const difficulty = isHome ? f.team_h_difficulty : f.team_a_difficulty;
-            return `${isHome ? 'H' : 'A'} ${opponent?.short_name || 'TBD'} (${difficulty})`;
-          });
+        const nextThreeFixtures = (fixturesByTeam.get(p.team) ?? []).slice(0, 3);
+        const upcomingFixtures = nextThreeFixtures.map(f => {
+          const isHome = f.team_h === p.team;
+          const opponent = teamsById.get(isHome ? f.team_a : f.team_h);
+          const difficulty = isHome ? f.team_h_difficulty : f.team_a_difficulty;
+          return `${isHome ? 'H' : 'A'} ${opponent?.short_name || 'TBD'} (${difficulty})`;
+        });
 
         const avgDifficulty =
-          upcomingFixtures.length > 0
-            ? fixtures
-                .filter(f => !f.finished && f.event && (f.team_h === p.team || f.team_a === p.team))
-                .slice(0, 3)
-                .reduce((sum, f) => {
-                  const difficulty = f.team_h === p.team ? f.team_h_difficulty : f.team_a_difficulty;
-                  return sum + difficulty;
-                }, 0) / 3
+          nextThreeFixtures.length > 0
+            ? nextThreeFixtures.reduce((sum, f) => {
+                const difficulty = f.team_h === p.team ? f.team_h_difficulty : f.team_a_difficulty;
+                return sum + difficulty;
+              }, 0) / 3
             : 3;
 
         const form = parseFloat(p.form);
@@ -140,12 +179,19 @@ export class InsightsGenerator {
       })
       .slice(0, 20);
 
+    // Key this gameweek's fixtures by team once rather than scanning the
+    // fixture list for every candidate
+    const currentFixtureByTeam = new Map<number, FPLFixture>();
+    for (const fixture of fixtures) {
+      if (fixture.finished || fixture.event !== currentGameweek) continue;
+      if (!currentFixtureByTeam.has(fixture.team_h)) currentFixtureByTeam.set(fixture.team_h, fixture);
+      if (!currentFixtureByTeam.has(fixture.team_a)) currentFixtureByTeam.set(fixture.team_a, fixture);
+    }
+
     const swings: CaptaincySwing[] = [];
 
     for (const player of topCandidates) {
-      const nextFixture = fixtures.find(
-        f => !f.finished && f.event === currentGameweek && (f.team_h === player.team || f.team_a === player.team)
-      );
+      const nextFixture = currentFixtureByTeam.get(player.team);
 
       if (!nextFixture) continue;
 
@@ -154,7 +200,7 @@ export class InsightsGenerator {
       const ownership = parseFloat(player.selected_by_percent);
 
       const basePoints = parseFloat(player.points_per_game);
-      const difficultyMultiplier = difficulty === 1 ? 1.3 : difficulty === 2 ? 1.15 : difficulty === 3 ? 1.0 : difficulty === 4 ? 0.85 : 0.7;
+      const difficultyMultiplier = DIFFICULTY_MULTIPLIERS[difficulty] || 1.0;
       const homeMultiplier = isHome ? 1.1 : 1.0;
       const expectedPoints = basePoints * difficultyMultiplier * homeMultiplier;
 
@@ -178,22 +224,26 @@ export class InsightsGenerator {
     fixtures: FPLFixture[],
     teams: FPLTeam[],
     currentGameweek: number
-  ): Promise<{
-    differentials: DifferentialPlayer[];
-    template: TemplatePlayer[];
-    captaincySwings: CaptaincySwing[];
-  }> {
+  ): Promise<WeeklyInsights> {
+    const cached = this.weeklyInsightsCache.get(currentGameweek);
+    if (cached && Date.now() - cached.cachedAt < this.WEEKLY_INSIGHTS_TTL) {
+      return cached.insights;
+    }
+
     const [differentials, template, captaincySwings] = await Promise.all([
       this.findDifferentials(allPlayers, fixtures, teams),
       this.findTemplatePlayers(allPlayers),
       this.analyzeCaptaincySwings(allPlayers, fixtures, teams, currentGameweek),
     ]);
 
-    return {
+    const insights: WeeklyInsights = {
       differentials,
       template,
       captaincySwings,
     };
+
+    this.weeklyInsightsCache.set(currentGameweek, { insights, cachedAt: Date.now() });
+    return insights;
   }
 }
 
@@ -1,7 +1,7 @@
 import { fplApi } from "./fpl-api";
 import { fplAuth } from "./fpl-auth";
 import { storage } from "./storage";
-import type { InsertUserTeam, FPLPick, FPLPlayer } from "@shared/schema";
+import type { InsertUserTeam, FPLPick, FPLPlayer, FPLManager } from "@shared/schema";
 
 interface SyncResult {
   success: boolean;
@@ -22,16 +22,22 @@ interface SyncResult {
 }
 
 export class ManagerSyncService {
-  async syncManagerTeam(managerId: number, userId: number): Promise<SyncResult> {
+  async syncManagerTeam(
+    managerId: number,
+    userId: number,
+    prefetchedDetails?: FPLManager
+  ): Promise<SyncResult> {
     try {
       const currentGameweek = await fplApi.getCurrentGameweek();
       const nextGameweek = await fplApi.getNextGameweek();
-      
+
       if (!currentGameweek && !nextGameweek) {
         throw new Error("Unable to determine current gameweek");
       }
 
-      const managerDetails = await fplApi.getManagerDetails(managerId);
+      // Callers that already validated the manager (e.g. the sync route) pass
+      // the details in so we don't repeat the same FPL API request
+      const managerDetails = prefetchedDetails ?? await fplApi.getManagerDetails(managerId);
       const planningGameweek = nextGameweek || currentGameweek!;
       
       // PRIORITY 1: Try authenticated my-team endpoint to get user's DRAFT lineup
@@ -124,6 +130,8 @@ export class ManagerSyncService {
         throw new Error("Unable to determine gameweek for sync");
       }
       const allPlayers = await fplApi.getPlayers();
+      // Index players by id once - avoids a linear scan of ~700 players per pick
+      const playersById = new Map(allPlayers.map(p => [p.id, p]));
 
       // Log first pick to verify FPL API returns price data
       if (picks.picks.length > 0) {
@@ -131,7 +139,7 @@ export class ManagerSyncService {
       }
 
       const players = picks.picks.map(pick => {
-        const playerData = allPlayers.find(p => p.id === pick.element);
+        const playerData = playersById.get(pick.element);
         
         // Validate price data exists
         if (!pick.purchase_price || !pick.selling_price) {
@@ -152,7 +160,7 @@ export class ManagerSyncService {
         };
       });
 
-      const formation = this.calculateFormation(picks.picks, allPlayers);
+      const formation = this.calculateFormation(picks.picks, playersById);
       
       const teamValue = picks.entry_history.value;
       const bank = picks.entry_history.bank;
@@ -255,13 +263,17 @@ export class ManagerSyncService {
         return null;
       }
 
-      // Try to get team for target gameweek, fall back to current if not found
-      let team = await storage.getTeam(userId, targetGameweek.id);
-      
-      if (!team && currentGameweek && targetGameweek.id !== currentGameweek.id) {
-        team = await storage.getTeam(userId, currentGameweek.id);
+      // Fetch target and fallback gameweeks in one indexed query, preferring
+      // the target - avoids a second roundtrip when the target has no team
+      const candidateGameweeks = [targetGameweek.id];
+      if (currentGameweek && currentGameweek.id !== targetGameweek.id) {
+        candidateGameweeks.push(currentGameweek.id);
       }
-      
+
+      const teams = await storage.getTeamsByGameweeks(userId, candidateGameweeks);
+      const team = teams.find(t => t.gameweek === targetGameweek.id)
+        ?? teams.find(t => t.gameweek === currentGameweek?.id);
+
       if (!team) {
         return null;
       }
@@ -293,9 +305,9 @@ export class ManagerSyncService {
     }
   }
 
-  private calculateFormation(picks: FPLPick[], allPlayers: FPLPlayer[]): string {
+  private calculateFormation(picks: FPLPick[], playersById: Map<number, FPLPlayer>): string {
     const startingPicks = picks.filter(p => p.position <= 11);
-    
+
     const positionCounts = {
       def: 0,
       mid: 0,
@@ -303,7 +315,7 @@ export class ManagerSyncService {
     };
 
     for (const pick of startingPicks) {
-      const player = allPlayers.find(p => p.id === pick.element);
+      const player = playersById.get(pick.element);
       if (!player) continue;
 
       switch (player.element_type) {
@@ -1,8 +1,8 @@
-import { storage } from "./storage";
+import { storage, type PlayerMinutesWindow } from "./storage";
 import { fplApi } from "./fpl-api";
 import type { FPLPlayer, InsertPlayerMinutesHistory } from "@shared/schema";
 
-interface MinutesProbability {
+export interface MinutesProbability {
   playerId: number;
   expectedMinutes: number;
   probabilityPlaying: number;
@@ -15,8 +15,11 @@ interface MinutesProbability {
 }
 
 export class MinutesEstimatorService {
-  async estimateMinutes(player: FPLPlayer): Promise<MinutesProbability> {
-    const history = await storage.getPlayerMinutesHistory(player.id, 10);
+  async estimateMinutes(
+    player: FPLPlayer,
+    preloadedHistory?: PlayerMinutesWindow[]
+  ): Promise<MinutesProbability> {
+    const history = preloadedHistory ?? await storage.getPlayerMinutesHistory(player.id, 10);
     
     const chanceOfPlaying = player.chance_of_playing_next_round ?? 100;
     const status = player.status;
@@ -60,13 +63,27 @@ export class MinutesEstimatorService {
     let probability0 = 0;
     
     if (history.length >= 3) {
-      const recent5 = history.slice(0, 5);
-      const gamesPlayed90 = recent5.filter(h => h.minutesPlayed >= 85).length;
-      const gamesPlayed60 = recent5.filter(h => h.minutesPlayed >= 60 && h.minutesPlayed < 85).length;
-      const gamesBenched = recent5.filter(h => h.minutesPlayed > 0 && h.minutesPlayed < 60).length;
-      const gamesNotPlayed = recent5.filter(h => h.minutesPlayed === 0).length;
-      
-      const total = recent5.length;
+      // Each game lands in exactly one bucket, so classify in a single pass
+      // instead of filtering the window four times - this runs once per player
+      // in squad- and pool-wide scoring loops
+      const total = Math.min(history.length, 5);
+      let gamesPlayed90 = 0;
+      let gamesPlayed60 = 0;
+      let gamesBenched = 0;
+      let gamesNotPlayed = 0;
+
+      for (let i = 0; i < total; i++) {
+        const minutes = history[i].minutesPlayed;
+        if (minutes >= 85) {
+          gamesPlayed90++;
+        } else if (minutes >= 60) {
+          gamesPlayed60++;
+        } else if (minutes > 0) {
+          gamesBenched++;
+        } else {
+          gamesNotPlayed++;
+        }
+      }
       probability90 = gamesPlayed90 / total;
       probability60 = gamesPlayed60 / total;
       probabilityBench = gamesBenched / total;
@@ -128,6 +145,24 @@ export class MinutesEstimatorService {
     };
   }
 
+  async estimateMinutesBulk(players: FPLPlayer[]): Promise<Map<number, MinutesProbability>> {
+    // Prefetch the whole cohort's history in one query, then estimate from
+    // memory - avoids a minutes-history SELECT per player in squad-wide loops
+    const historyByPlayer = await storage.getPlayerMinutesHistoryBulk(
+      players.map(p => p.id),
+      10
+    );
+
+    const estimates = new Map<number, MinutesProbability>();
+    for (const player of players) {
+      estimates.set(
+        player.id,
+        await this.estimateMinutes(player, historyByPlayer.get(player.id) ?? [])
+      );
+    }
+    return estimates;
+  }
+
   async recordMinutesForGameweek(gameweek: number): Promise<number> {
     console.log(`[MinutesEstimator] Recording minutes history for GW${gameweek}`);
     
@@ -141,12 +176,28 @@ export class MinutesEstimatorService {
 
     const players = await fplApi.getPlayers();
     const records: InsertPlayerMinutesHistory[] = [];
-    
-    for (const player of players) {
-      try {
-        const playerDetails = await fplApi.getPlayerDetails(player.id);
+    let recordedCount = 0;
+
+    // Fetch player details in concurrent batches - the loop is network-bound
+    // and ~700 serial element-summary requests dominated the sync time.
+    // DB writes stay serial below so inserts remain ordered batches.
+    const FETCH_CONCURRENCY = 8;
+
+    for (let i = 0; i < players.length; i += FETCH_CONCURRENCY) {
+      const batch = players.slice(i, i + FETCH_CONCURRENCY);
+      const details = await Promise.all(
+        batch.map(player =>
+          fplApi.getPlayerDetails(player.id).catch(() => null)
+        )
+      );
+
+      for (let j = 0; j < batch.length; j++) {
+        const player = batch[j];
+        const playerDetails = details[j];
+        if (!playerDetails) continue;
+
         const gwHistory = playerDetails.history?.find((h: any) => h.round === gameweek);
-        
+
         if (gwHistory) {
           records.push({
             playerId: player.id,
@@ -159,21 +210,22 @@ export class MinutesEstimatorService {
             chanceOfPlaying: player.chance_of_playing_next_round ?? 100
           });
         }
-      } catch (error) {
       }
-      
+
       if (records.length >= 50) {
         await storage.bulkSavePlayerMinutesHistory(records);
+        recordedCount += records.length;
         records.length = 0;
       }
     }
-    
+
     if (records.length > 0) {
       await storage.bulkSavePlayerMinutesHistory(records);
+      recordedCount += records.length;
     }
-    
-    console.log(`[MinutesEstimator] Recorded minutes for GW${gameweek}`);
-    return records.length;
+
+    console.log(`[MinutesEstimator] Recorded minutes for ${recordedCount} players in GW${gameweek}`);
+    return recordedCount;
   }
 
   adjustPredictionForMinutes(basePrediction: number, minutesProbability: MinutesProbability): number {
@@ -64,6 +64,10 @@ export async function updateTrackingPredictions(
     let updatedCount = 0;
     let completedCount = 0;
 
+    // One close timestamp for the whole run instead of a clock read per row;
+    // every prediction completed by this pass closes at the same instant
+    const closedAt = new Date();
+
     for (const prediction of trackingPredictions) {
       try {
         // Calculate weeks elapsed (clamped to timeframe)
@@ -126,7 +130,7 @@ export async function updateTrackingPredictions(
             pointsActualToDate: actualGain,
             actualGainFinal: actualGain,
             accuracyPercent,
-            closedAt: new Date()
+            closedAt
           });
           completedCount++;
         } else {
@@ -166,9 +170,21 @@ export async function voidInvalidPredictions(
 
     let voidedCount = 0;
 
+    // Run-invariant lookups hoisted out of the per-prediction loop: one
+    // player-list fetch and one close timestamp for the whole pass, and
+    // user settings resolved once per user rather than once per prediction
+    const players = await fplApi.getPlayers();
+    const playersById = new Map<number, any>(players.map((p: { id: number }) => [p.id, p]));
+    const closedAt = new Date();
+    const userSettingsCache = new Map<number, any>();
+
     for (const prediction of trackingPredictions) {
       try {
-        const userSettings = await storage.getUserSettings(prediction.userId);
+        let userSettings = userSettingsCache.get(prediction.userId);
+        if (userSettings === undefined) {
+          userSettings = await storage.getUserSettings(prediction.userId);
+          userSettingsCache.set(prediction.userId, userSettings ?? null);
+        }
         if (!userSettings?.manager_id) {
           console.log(`[Multi-Week Tracker] Skipping prediction ${prediction.id}: No manager_id found`);
           continue;
@@ -184,7 +200,7 @@ export async function voidInvalidPredictions(
             await storage.updatePredictionTracking(prediction.id, {
               status: 'voided',
               voidReason: 'player_sold_early',
-              closedAt: new Date(),
+              closedAt,
               actualGainFinal: prediction.pointsActualToDate,
               weeksElapsed
             });
@@ -193,15 +209,14 @@ export async function voidInvalidPredictions(
             continue;
           }
 
-          const players = await fplApi.getPlayers();
-          const playerIn = players.find((p: { id: number }) => p.id === prediction.playerInId);
-          
+          const playerIn = playersById.get(prediction.playerInId);
+
           if (playerIn && playerIn.status !== 'a' && playerIn.chance_of_playing_next_round !== null && playerIn.chance_of_playing_next_round < 25) {
             const weeksElapsed = currentGW - prediction.startGameweek;
             await storage.updatePredictionTracking(prediction.id, {
               status: 'voided',
               voidReason: 'injury',
-              closedAt: new Date(),
+              closedAt,
               actualGainFinal: prediction.pointsActualToDate,
               weeksElapsed
             });
@@ -22,17 +22,52 @@ export interface FixtureDifficulty {
   rating: 'easy' | 'moderate' | 'difficult' | 'very_difficult';
 }
 
+interface LeagueStrengthAverages {
+  attackHome: number;
+  attackAway: number;
+  defenseHome: number;
+  defenseAway: number;
+}
+
 export class OpponentStrengthAnalyzer {
+  // League-wide strength-column averages, computed in one pass and memoized
+  // per team list. The per-team and per-fixture analyses all normalize
+  // against the same four averages, so without this every call re-reduced
+  // the whole team list column by column.
+  private leagueAveragesCache = new WeakMap<FPLTeam[], LeagueStrengthAverages>();
+
+  private getLeagueStrengthAverages(allTeams: FPLTeam[]): LeagueStrengthAverages {
+    const cached = this.leagueAveragesCache.get(allTeams);
+    if (cached) return cached;
+
+    let attackHome = 0;
+    let attackAway = 0;
+    let defenseHome = 0;
+    let defenseAway = 0;
+    for (const t of allTeams) {
+      attackHome += t.strength_attack_home;
+      attackAway += t.strength_attack_away;
+      defenseHome += t.strength_defence_home;
+      defenseAway += t.strength_defence_away;
+    }
+
+    const averages: LeagueStrengthAverages = {
+      attackHome: attackHome / allTeams.length,
+      attackAway: attackAway / allTeams.length,
+      defenseHome: defenseHome / allTeams.length,
+      defenseAway: defenseAway / allTeams.length,
+    };
+    this.leagueAveragesCache.set(allTeams, averages);
+    return averages;
+  }
+
   analyzeTeamStrength(team: FPLTeam, allTeams: FPLTeam[]): OpponentStrengthMetrics {
-    const avgAttackHome = allTeams.reduce((sum, t) => sum + t.strength_attack_home, 0) / allTeams.length;
-    const avgAttackAway = allTeams.reduce((sum, t) => sum + t.strength_attack_away, 0) / allTeams.length;
-    const avgDefenseHome = allTeams.reduce((sum, t) => sum + t.strength_defence_home, 0) / allTeams.length;
-    const avgDefenseAway = allTeams.reduce((sum, t) => sum + t.strength_defence_away, 0) / allTeams.length;
+    const averages = this.getLeagueStrengthAverages(allTeams);
 
-    const relativeAttackHome = team.strength_attack_home / avgAttackHome;
-    const relativeAttackAway = team.strength_attack_away / avgAttackAway;
-    const relativeDefenseHome = team.strength_defence_home / avgDefenseHome;
-    const relativeDefenseAway = team.strength_defence_away / avgDefenseAway;
+    const relativeAttackHome = team.strength_attack_home / averages.attackHome;
+    const relativeAttackAway = team.strength_attack_away / averages.attackAway;
+    const relativeDefenseHome = team.strength_defence_home / averages.defenseHome;
+    const relativeDefenseAway = team.strength_defence_away / averages.defenseAway;
 
     const overallStrength =
       (relativeAttackHome + relativeAttackAway + relativeDefenseHome + relativeDefenseAway) / 4;
@@ -53,6 +88,16 @@ export class OpponentStrengthAnalyzer {
     };
   }
 
+  // Difficulty scores depend only on the opponent and venue, not on the
+  // fixture or analyzed team, so the (opponentId, isHome) pair - packed
+  // into one small integer key - memoizes the strength normalization per
+  // team list. Every player of a side facing the same opponent then reuses
+  // one computation instead of re-analyzing the opponent per fixture.
+  private difficultyCache = new WeakMap<
+    FPLTeam[],
+    Map<number, { attackDifficulty: number; defenseDifficulty: number }>
+  >();
+
   analyzeFixtureDifficulty(
     fixture: FPLFixture,
     teamId: number,
@@ -61,45 +106,55 @@ export class OpponentStrengthAnalyzer {
     const isHome = fixture.team_h === teamId;
     const opponentId = isHome ? fixture.team_a : fixture.team_h;
 
-    const opponent = allTeams.find(t => t.id === opponentId);
-    if (!opponent) {
-      return {
-        fixtureId: fixture.id,
-        teamId,
-        opponentId,
-        isHome,
-        difficulty: 3,
-        attackDifficulty: 3,
-        defenseDifficulty: 3,
-        rating: 'moderate',
-      };
+    let difficultyByOpponent = this.difficultyCache.get(allTeams);
+    if (!difficultyByOpponent) {
+      difficultyByOpponent = new Map();
+      this.difficultyCache.set(allTeams, difficultyByOpponent);
     }
 
-    const opponentMetrics = this.analyzeTeamStrength(opponent, allTeams);
+    const key = opponentId * 2 + (isHome ? 1 : 0);
+    let core = difficultyByOpponent.get(key);
+
+    if (core === undefined) {
+      const opponent = allTeams.find(t => t.id === opponentId);
+      if (!opponent) {
+        return {
+          fixtureId: fixture.id,
+          teamId,
+          opponentId,
+          isHome,
+          difficulty: 3,
+          attackDifficulty: 3,
+          defenseDifficulty: 3,
+          rating: 'moderate',
+        };
+      }
 
-    const opponentAttackStrength = isHome
-      ? opponentMetrics.attackStrengthAway
-      : opponentMetrics.attackStrengthHome;
+      const opponentMetrics = this.analyzeTeamStrength(opponent, allTeams);
 
-    const opponentDefenseStrength = isHome
-      ? opponentMetrics.defenseStrengthAway
-      : opponentMetrics.defenseStrengthHome;
+      const opponentAttackStrength = isHome
+        ? opponentMetrics.attackStrengthAway
+        : opponentMetrics.attackStrengthHome;
 
-    const avgAttack = allTeams.reduce(
-      (sum, t) => sum + (isHome ? t.strength_attack_away : t.strength_attack_home),
-      0
-    ) / allTeams.length;
+      const opponentDefenseStrength = isHome
+        ? opponentMetrics.defenseStrengthAway
+        : opponentMetrics.defenseStrengthHome;
 
-    const avgDefense = allTeams.reduce(
-      (sum, t) => sum + (isHome ? t.strength_defence_away : t.strength_defence_home),
-      0
-    ) / allTeams.length;
+      const averages = this.getLeagueStrengthAverages(allTeams);
+      const avgAttack = isHome ? averages.attackAway : averages.attackHome;
+      const avgDefense = isHome ? averages.defenseAway : averages.defenseHome;
 
-    const attackDifficultyRaw = opponentDefenseStrength / avgDefense;
-    const defenseDifficultyRaw = opponentAttackStrength / avgAttack;
+      const attackDifficultyRaw = opponentDefenseStrength / avgDefense;
+      const defenseDifficultyRaw = opponentAttackStrength / avgAttack;
+
+      core = {
+        attackDifficulty: Math.max(1, Math.min(5, Math.round(attackDifficultyRaw * 3))),
+        defenseDifficulty: Math.max(1, Math.min(5, Math.round(defenseDifficultyRaw * 3))),
+      };
+      difficultyByOpponent.set(key, core);
+    }
 
-    const attackDifficulty = Math.max(1, Math.min(5, Math.round(attackDifficultyRaw * 3)));
-    const defenseDifficulty = Math.max(1, Math.min(5, Math.round(defenseDifficultyRaw * 3)));
+    const { attackDifficulty, defenseDifficulty } = core;
 
     const overallDifficulty = Math.round((attackDifficulty + defenseDifficulty) / 2);
 
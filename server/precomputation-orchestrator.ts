@@ -47,26 +47,39 @@ interface PrecomputationJob {
  * @param currentGameweek - Current gameweek number
  * @returns Average difficulty score (0 if no upcoming fixtures)
  */
-function calculateTeamFixtureDifficulty(
-  team: FPLTeam,
+function calculateFixtureDifficultyByTeam(
   fixtures: FPLFixture[],
   currentGameweek: number
-): number {
-  const upcoming = fixtures
-    .filter(f => 
-      f.event && f.event > currentGameweek && f.event <= currentGameweek + 6 &&
-      (f.team_h === team.id || f.team_a === team.id)
-    )
-    .slice(0, 6);
-  
-  const totalDifficulty = upcoming.reduce((sum, fixture) => {
-    const difficulty = fixture.team_h === team.id 
-      ? fixture.team_h_difficulty 
-      : fixture.team_a_difficulty;
-    return sum + difficulty;
-  }, 0);
-  
-  return upcoming.length > 0 ? totalDifficulty / upcoming.length : 0;
+): Map<number, number> {
+  // Aggregate every team's next-six-gameweek difficulty in one pass over the
+  // fixture list instead of re-filtering all fixtures once per team
+  const difficultiesByTeam = new Map<number, number[]>();
+
+  const record = (teamId: number, difficulty: number) => {
+    let list = difficultiesByTeam.get(teamId);
+    if (!list) {
+      list = [];
+      difficultiesByTeam.set(teamId, list);
+    }
+    if (list.length < 6) {
+      list.push(difficulty);
+    }
+  };
+
+  for (const fixture of fixtures) {
+    if (!fixture.event || fixture.event <= currentGameweek || fixture.event > currentGameweek + 6) {
+      continue;
+    }
+    record(fixture.team_h, fixture.team_h_difficulty);
+    record(fixture.team_a, fixture.team_a_difficulty);
+  }
+
+  const averages = new Map<number, number>();
+  for (const [teamId, difficulties] of difficultiesByTeam.entries()) {
+    const total = difficulties.reduce((sum, d) => sum + d, 0);
+    averages.set(teamId, total / difficulties.length);
+  }
+  return averages;
 }
 
 /**
@@ -74,17 +87,37 @@ function calculateTeamFixtureDifficulty(
  */
 
 function analyzeOptimalBenchBoost(fixtures: FPLFixture[], teams: FPLTeam[], currentGW: number) {
-  const gws = Array.from({ length: 10 }, (_, i) => currentGW + i + 1);
-  const doubleGameweeks = gws.filter(gw => {
-    const gwFixtures = fixtures.filter(f => f.event === gw);
-    const teamsPlaying = gwFixtures.flatMap(f => [f.team_h, f.team_a]);
-    return teamsPlaying.some((team, idx) => teamsPlaying.indexOf(team) !== idx);
-  });
-  
+  // Count each team's fixtures per gameweek in a single sweep over the
+  // fixture list, rather than re-filtering all fixtures (and running a
+  // quadratic indexOf duplicate scan) for each of the ten candidate weeks
+  const minGW = currentGW + 1;
+  const maxGW = currentGW + 10;
+  const teamCountsByGw = new Map<number, Map<number, number>>();
+
+  for (const fixture of fixtures) {
+    if (!fixture.event || fixture.event < minGW || fixture.event > maxGW) continue;
+    let counts = teamCountsByGw.get(fixture.event);
+    if (!counts) {
+      counts = new Map();
+      teamCountsByGw.set(fixture.event, counts);
+    }
+    counts.set(fixture.team_h, (counts.get(fixture.team_h) || 0) + 1);
+    counts.set(fixture.team_a, (counts.get(fixture.team_a) || 0) + 1);
+  }
+
+  let firstDoubleGameweek: number | undefined;
+  for (let gw = minGW; gw <= maxGW; gw++) {
+    const counts = teamCountsByGw.get(gw);
+    if (counts && Array.from(counts.values()).some(count => count >= 2)) {
+      firstDoubleGameweek = gw;
+      break;
+    }
+  }
+
   return {
-    recommendedGameweek: doubleGameweeks[0] || currentGW + 5,
-    reasoning: doubleGameweeks.length > 0 
-      ? `Double gameweek detected in GW${doubleGameweeks[0]}` 
+    recommendedGameweek: firstDoubleGameweek || currentGW + 5,
+    reasoning: firstDoubleGameweek !== undefined
+      ? `Double gameweek detected in GW${firstDoubleGameweek}`
       : 'No double gameweeks found, defaulting to mid-season'
   };
 }
@@ -129,13 +162,17 @@ class PrecomputationOrchestrator {
     console.log(`[Precomputation] Starting batch jobs for snapshot ${context.snapshotId} (GW${context.gameweek})`);
     
     const expiresAt = new Date(context.timestamp + 5 * 60 * 1000);
-    
-    await Promise.all([
+
+    // Build all precomputation rows first, then persist them in a single
+    // multi-row insert instead of one INSERT per computation type
+    const precomputations = [
       this.precomputeFixtureDifficulty(context, expiresAt),
       this.precomputeCaptainShortlist(context, expiresAt),
       this.precomputeChipHeuristics(context, expiresAt),
-    ]);
-    
+    ];
+
+    await storage.savePrecomputations(precomputations);
+
     console.log(`[Precomputation] Completed batch jobs for snapshot ${context.snapshotId}`);
   }
 
@@ -153,19 +190,22 @@ class PrecomputationOrchestrator {
    * @param context - Snapshot context with all FPL data
    * @param expiresAt - Expiration timestamp (aligned with snapshot TTL)
    */
-  private async precomputeFixtureDifficulty(
+  private precomputeFixtureDifficulty(
     context: SnapshotContext,
     expiresAt: Date
-  ): Promise<void> {
+  ): InsertAiPrecomputation {
     const fixtures = context.snapshot.data.fixtures;
     const teams = context.snapshot.data.teams;
     
+    const difficultyByTeam = calculateFixtureDifficultyByTeam(fixtures, context.gameweek);
     const difficultyScores = teams.map(team => ({
       teamId: team.id,
-      nextSixGWDifficulty: calculateTeamFixtureDifficulty(team, fixtures, context.gameweek)
+      nextSixGWDifficulty: difficultyByTeam.get(team.id) ?? 0
     }));
     
-    const precomputation: InsertAiPrecomputation = {
+    console.log(`[Precomputation] Fixture difficulty computed for ${teams.length} teams`);
+
+    return {
       snapshotId: context.snapshotId,
       gameweek: context.gameweek,
       computationType: 'fixture_difficulty',
@@ -173,20 +213,16 @@ class PrecomputationOrchestrator {
       result: difficultyScores,
       expiresAt,
     };
-    
-    await storage.savePrecomputation(precomputation);
-    
-    console.log(`[Precomputation] Saved fixture difficulty for ${teams.length} teams`);
   }
 
   /**
    * Precompute captain shortlist based on form, fixtures, and ownership
    * Returns top 10 captain candidates with expected points range
    */
-  private async precomputeCaptainShortlist(
+  private precomputeCaptainShortlist(
     context: SnapshotContext,
     expiresAt: Date
-  ): Promise<void> {
+  ): InsertAiPrecomputation {
     const players = context.snapshot.data.players;
     const teams = context.snapshot.data.teams;
     const fixtures = context.snapshot.data.fixtures;
@@ -220,27 +256,26 @@ class PrecomputationOrchestrator {
     .sort((a, b) => b.score - a.score)
     .slice(0, 10); // Top 10
     
-    // Save to database
-    await storage.savePrecomputation({
+    console.log(`[Precomputation] Captain shortlist: ${captainCandidates.length} candidates`);
+
+    return {
       snapshotId: context.snapshotId,
       gameweek: context.gameweek,
       computationType: 'captain_shortlist',
       playerId: null, // Not player-specific
       result: captainCandidates,
       expiresAt,
-    });
-    
-    console.log(`[Precomputation] Captain shortlist: ${captainCandidates.length} candidates`);
+    };
   }
 
   /**
    * Precompute chip timing heuristics based on fixtures and team form
    * Suggests optimal gameweeks for each chip type
    */
-  private async precomputeChipHeuristics(
+  private precomputeChipHeuristics(
     context: SnapshotContext,
     expiresAt: Date
-  ): Promise<void> {
+  ): InsertAiPrecomputation {
     const fixtures = context.snapshot.data.fixtures;
     const teams = context.snapshot.data.teams;
     const gameweek = context.gameweek;
@@ -253,16 +288,16 @@ class PrecomputationOrchestrator {
       wildcard: analyzeOptimalWildcard(fixtures, teams, gameweek),
     };
     
-    await storage.savePrecomputation({
+    console.log(`[Precomputation] Chip heuristics computed for GW${gameweek}`);
+
+    return {
       snapshotId: context.snapshotId,
       gameweek: context.gameweek,
       computationType: 'chip_heuristics',
       playerId: null,
       result: chipRecommendations,
       expiresAt,
-    });
-    
-    console.log(`[Precomputation] Chip heuristics computed for GW${gameweek}`);
+    };
   }
 }
 
@@ -1,5 +1,6 @@
 import { storage } from './storage';
 import { fplApi } from './fpl-api';
+import { gameweekSnapshot } from './gameweek-data-snapshot';
 import type { GameweekPlan } from '../shared/schema';
 import OpenAI from 'openai';
 import Anthropic from '@anthropic-ai/sdk';
@@ -14,6 +15,30 @@ const anthropic = process.env.ANTHROPIC_API_KEY
   ? new Anthropic({ apiKey: process.env.ANTHROPIC_API_KEY })
   : null;
 
+// One formatter per FPL explain identifier, built once at module load so
+// formatting a breakdown is a table lookup per entry rather than a walk
+// through a switch cascade
+const SCORING_FORMATTERS: Record<string, (points: number, value: number) => string> = {
+  minutes: (points, value) => `${value} mins: ${points > 0 ? '+' : ''}${points}`,
+  goals_scored: (points, value) => `${value}G: +${points}`,
+  assists: (points, value) => `${value}A: +${points}`,
+  clean_sheets: (points) => `CS: +${points}`,
+  defensive_contribution: (points) => `Def: +${points}`,
+  yellow_cards: (points, value) => `${value}YC: ${points}`,
+  red_cards: (points, value) => `${value}RC: ${points}`,
+  bonus: (points) => `Bonus: +${points}`,
+  saves: (points, value) => `${value} saves: +${points}`,
+  goals_conceded: (points, value) => `${value} GC: ${points}`,
+  penalties_saved: (points, value) => `${value} pen saved: +${points}`,
+  penalties_missed: (points, value) => `${value} pen missed: ${points}`,
+  own_goals: (points, value) => `${value}OG: ${points}`,
+  penalties_conceded: (points, value) => `${value} pen conceded: ${points}`,
+};
+
+// Position labels indexed by element_type - 1, hoisted so the squad mapping
+// doesn't allocate the table per player
+const POSITION_LABELS = ['GKP', 'DEF', 'MID', 'FWD'] as const;
+
 interface PredictionFailureAnalysis {
   gameweek: number;
   predicted: number;
@@ -110,54 +135,13 @@ export class PredictionAnalysisService {
     for (const [identifier, data] of Object.entries(scoringBreakdown)) {
       const points = (data as any).points;
       const value = (data as any).value;
-      
-      switch (identifier) {
-        case 'minutes':
-          breakdown.push(`${value} mins: ${points > 0 ? '+' : ''}${points}`);
-          break;
-        case 'goals_scored':
-          breakdown.push(`${value}G: +${points}`);
-          break;
-        case 'assists':
-          breakdown.push(`${value}A: +${points}`);
-          break;
-        case 'clean_sheets':
-          breakdown.push(`CS: +${points}`);
-          break;
-        case 'defensive_contribution':
-          breakdown.push(`Def: +${points}`);
-          break;
-        case 'yellow_cards':
-          breakdown.push(`${value}YC: ${points}`);
-          break;
-        case 'red_cards':
-          breakdown.push(`${value}RC: ${points}`);
-          break;
-        case 'bonus':
-          breakdown.push(`Bonus: +${points}`);
-          break;
-        case 'saves':
-          breakdown.push(`${value} saves: +${points}`);
-          break;
-        case 'goals_conceded':
-          breakdown.push(`${value} GC: ${points}`);
-          break;
-        case 'penalties_saved':
-          breakdown.push(`${value} pen saved: +${points}`);
-          break;
-        case 'penalties_missed':
-          breakdown.push(`${value} pen missed: ${points}`);
-          break;
-        case 'own_goals':
-          breakdown.push(`${value}OG: ${points}`);
-          break;
-        case 'penalties_conceded':
-          breakdown.push(`${value} pen conceded: ${points}`);
-          break;
-        default:
-          // Handle any unknown identifiers to ensure no silent omissions
-          breakdown.push(`${identifier}: ${points > 0 ? '+' : ''}${points}`);
-          break;
+
+      const formatter = SCORING_FORMATTERS[identifier];
+      if (formatter) {
+        breakdown.push(formatter(points, value));
+      } else {
+        // Handle any unknown identifiers to ensure no silent omissions
+        breakdown.push(`${identifier}: ${points > 0 ? '+' : ''}${points}`);
       }
     }
     
@@ -180,7 +164,6 @@ export class PredictionAnalysisService {
   }> {
     try {
       // Use unified snapshot for consistency across all analysis
-      const { gameweekSnapshot } = await import('./gameweek-data-snapshot');
       const snapshot = await gameweekSnapshot.getSnapshot(gameweek, false); // Don't need Understat for analysis
       
       console.log(`[PredictionAnalysis] Using snapshot from ${new Date(snapshot.timestamp).toISOString()}`);
@@ -222,6 +205,11 @@ export class PredictionAnalysisService {
         }
       }
 
+      // Key snapshot players and teams by id once - the squad mapping below
+      // otherwise scans the full player list for every pick
+      const playersById = new Map<number, any>(allPlayers.map((pl: any) => [pl.id, pl]));
+      const teamsById = new Map<number, any>(allTeams.map((t: any) => [t.id, t]));
+
       // Store captain info for later use
       const captainInfo = userTeam.players.find((p: any) => p.is_captain);
       
@@ -253,7 +241,7 @@ export class PredictionAnalysisService {
       const teamPerformance = userTeam.players
         .filter((p: any) => p.player_id) // Filter out null player_ids
         .map((p: any) => {
-          const playerData = allPlayers.find((pl: any) => pl.id === p.player_id);
+          const playerData = playersById.get(p.player_id);
           const liveElement = livePlayerData.get(p.player_id);
           const eventPoints = liveElement?.stats.total_points || 0;
           
@@ -272,7 +260,7 @@ export class PredictionAnalysisService {
           return {
             name: playerData?.web_name || 'Unknown',
             points: eventPoints,
-            position: ['GKP', 'DEF', 'MID', 'FWD'][(playerData?.element_type || 1) - 1] || 'Unknown',
+            position: POSITION_LABELS[(playerData?.element_type || 1) - 1] || 'Unknown',
             isCaptain: p.is_captain,
             lineupPosition: p.position, // 1-15 lineup slot
             playedFromBench: wasAutoSubbed, // TRUE auto-sub check (or fallback heuristic)
@@ -321,10 +309,7 @@ export class PredictionAnalysisService {
       // Get relevant fixtures for teams in squad (players who actually played)
       const relevantTeamIds = new Set(
         teamPerformance
-          .map((p: any) => {
-            const playerData = allPlayers.find((pl: any) => pl.name === p.name);
-            return playerData?.team;
-          })
+          .map((p: any) => playersById.get(p.player_id)?.team)
           .filter(Boolean)
       );
 
@@ -335,8 +320,8 @@ export class PredictionAnalysisService {
         )
         .slice(0, 8) // Limit to 8 fixtures
         .map((f: any) => {
-          const homeTeam = allTeams.find((t: any) => t.id === f.team_h);
-          const awayTeam = allTeams.find((t: any) => t.id === f.team_a);
+          const homeTeam = teamsById.get(f.team_h);
+          const awayTeam = teamsById.get(f.team_a);
           return {
             team: homeTeam?.name || 'Unknown',
             opponent: awayTeam?.name || 'Unknown',
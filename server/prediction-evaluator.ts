@@ -121,14 +121,42 @@ export class PredictionEvaluatorService {
       lessonsLearned
     };
 
-    await storage.savePredictionEvaluation(evaluation);
-    console.log(`[PredictionEvaluator] Saved evaluation for GW${gameweek}`);
+    // Persist the evaluation and its bias metrics in one transaction
+    const biasMetricsRows = this.buildBiasMetricsRows(gameweek, positionMetrics, overallMetrics);
+    await storage.saveGameweekEvaluation(evaluation, biasMetricsRows);
+    console.log(`[PredictionEvaluator] Saved evaluation and bias metrics for ${biasMetricsRows.length} positions for GW${gameweek}`);
 
-    await this.saveBiasMetrics(gameweek, positionMetrics, overallMetrics);
+    calibrationService.clearCache();
+    console.log(`[PredictionEvaluator] Cleared calibration cache to apply new factors immediately`);
 
     return evaluation;
   }
 
+  // Accumulate error, bias and squared error in one pass over the results
+  // rather than reducing the same array three times
+  private computeMetrics(
+    results: PlayerPredictionResult[],
+    position: PositionMetrics['position']
+  ): PositionMetrics {
+    let totalError = 0;
+    let totalBias = 0;
+    let squaredErrors = 0;
+
+    for (const r of results) {
+      totalError += r.error;
+      totalBias += r.bias;
+      squaredErrors += r.error * r.error;
+    }
+
+    return {
+      position,
+      sampleSize: results.length,
+      mae: totalError / results.length,
+      bias: totalBias / results.length,
+      rmse: Math.sqrt(squaredErrors / results.length)
+    };
+  }
+
   private calculatePositionMetrics(results: PlayerPredictionResult[]): { [key in 'GK' | 'DEF' | 'MID' | 'FWD']?: PositionMetrics } {
     const positions: ('GK' | 'DEF' | 'MID' | 'FWD')[] = ['GK', 'DEF', 'MID', 'FWD'];
     const metrics: { [key in 'GK' | 'DEF' | 'MID' | 'FWD']?: PositionMetrics } = {};
@@ -136,17 +164,7 @@ export class PredictionEvaluatorService {
     for (const pos of positions) {
       const posResults = results.filter(r => r.position === pos);
       if (posResults.length > 0) {
-        const totalError = posResults.reduce((sum, r) => sum + r.error, 0);
-        const totalBias = posResults.reduce((sum, r) => sum + r.bias, 0);
-        const squaredErrors = posResults.reduce((sum, r) => sum + r.error * r.error, 0);
-        
-        metrics[pos] = {
-          position: pos,
-          sampleSize: posResults.length,
-          mae: totalError / posResults.length,
-          bias: totalBias / posResults.length,
-          rmse: Math.sqrt(squaredErrors / posResults.length)
-        };
+        metrics[pos] = this.computeMetrics(posResults, pos);
       }
     }
 
@@ -154,32 +172,23 @@ export class PredictionEvaluatorService {
   }
 
   private calculateOverallMetrics(results: PlayerPredictionResult[]): PositionMetrics {
-    const totalError = results.reduce((sum, r) => sum + r.error, 0);
-    const totalBias = results.reduce((sum, r) => sum + r.bias, 0);
-    const squaredErrors = results.reduce((sum, r) => sum + r.error * r.error, 0);
-    
-    return {
-      position: 'ALL',
-      sampleSize: results.length,
-      mae: totalError / results.length,
-      bias: totalBias / results.length,
-      rmse: Math.sqrt(squaredErrors / results.length)
-    };
+    return this.computeMetrics(results, 'ALL');
   }
 
-  private async saveBiasMetrics(
-    gameweek: number, 
+  private buildBiasMetricsRows(
+    gameweek: number,
     positionMetrics: { [key in 'GK' | 'DEF' | 'MID' | 'FWD']?: PositionMetrics },
     overallMetrics: PositionMetrics
-  ): Promise<void> {
+  ): InsertPredictionBiasMetrics[] {
     const positions: ('GK' | 'DEF' | 'MID' | 'FWD' | 'ALL')[] = ['GK', 'DEF', 'MID', 'FWD', 'ALL'];
-    
+
+    const biasMetricsRows: InsertPredictionBiasMetrics[] = [];
     for (const pos of positions) {
       const metrics = pos === 'ALL' ? overallMetrics : positionMetrics[pos];
       if (metrics) {
         const calibrationFactor = this.calculateCalibrationFactor(metrics.bias);
-        
-        const biasMetrics: InsertPredictionBiasMetrics = {
+
+        biasMetricsRows.push({
           gameweek,
           position: pos,
           sampleSize: metrics.sampleSize,
@@ -187,15 +196,13 @@ export class PredictionEvaluatorService {
           meanBias: metrics.bias,
           rootMeanSquareError: metrics.rmse,
           calibrationFactor
-        };
-        
-        await storage.savePredictionBiasMetrics(biasMetrics);
-        console.log(`[PredictionEvaluator] Saved bias metrics for ${pos}: MAE=${metrics.mae.toFixed(2)}, Bias=${metrics.bias.toFixed(2)}, Calibration=${calibrationFactor.toFixed(3)}`);
+        });
+
+        console.log(`[PredictionEvaluator] Bias metrics for ${pos}: MAE=${metrics.mae.toFixed(2)}, Bias=${metrics.bias.toFixed(2)}, Calibration=${calibrationFactor.toFixed(3)}`);
       }
     }
 
-    calibrationService.clearCache();
-    console.log(`[PredictionEvaluator] Cleared calibration cache to apply new factors immediately`);
+    return biasMetricsRows;
   }
 
   private calculateCalibrationFactor(bias: number): number {
@@ -288,21 +295,49 @@ export class PredictionEvaluatorService {
       return { updated: 0, attempted: 0, notFinished: false };
     }
     
+    // One live-data request carries every player's finished total for the
+    // gameweek, replacing an element-summary fetch per prediction; fall back
+    // to per-player history only if the live endpoint is unavailable
+    let actualPointsById: Map<number, number> | null = null;
+    try {
+      const liveData = await fplApi.getLiveGameweekData(gameweek);
+      actualPointsById = new Map(
+        (liveData.elements ?? []).map((el: any) => [el.id, el.stats?.total_points ?? 0])
+      );
+    } catch (error) {
+      console.error(`[PredictionEvaluator] Failed to fetch live data for GW${gameweek}, falling back to per-player history:`, error);
+    }
+
+    const playersById = new Map(playersData.map((p: FPLPlayer) => [p.id, p]));
+
     let updatedCount = 0;
     let attemptedCount = 0;
-    
+    const updatesByUser = new Map<number, Array<{ playerId: number; actualPoints: number }>>();
+
     for (const pred of predictionsToUpdate) {
-      const player = playersData.find((p: FPLPlayer) => p.id === pred.playerId);
-      if (player) {
-        attemptedCount++;
-        const actualPoints = await this.getPlayerActualPoints(pred.playerId, gameweek);
-        if (actualPoints !== null) {
-          await storage.updateActualPointsByPlayer(pred.userId, gameweek, pred.playerId, actualPoints);
-          updatedCount++;
+      if (!playersById.has(pred.playerId)) continue;
+
+      attemptedCount++;
+      const actualPoints = actualPointsById
+        ? actualPointsById.get(pred.playerId) ?? null
+        : await this.getPlayerActualPoints(pred.playerId, gameweek);
+
+      if (actualPoints !== null) {
+        const userUpdates = updatesByUser.get(pred.userId);
+        if (userUpdates) {
+          userUpdates.push({ playerId: pred.playerId, actualPoints });
+        } else {
+          updatesByUser.set(pred.userId, [{ playerId: pred.playerId, actualPoints }]);
         }
+        updatedCount++;
       }
     }
-    
+
+    // One CASE-based bulk UPDATE per user instead of a statement per prediction
+    for (const [userId, updates] of updatesByUser.entries()) {
+      await storage.bulkUpdateActualPoints(userId, gameweek, updates);
+    }
+
     console.log(`[PredictionEvaluator] Updated ${updatedCount}/${attemptedCount} predictions with actual points`);
     return { updated: updatedCount, attempted: attemptedCount, notFinished: false };
   }
@@ -22,6 +22,7 @@ import { enhancedAIPredictions } from "./enhanced-ai-predictions";
 import { insightsGenerator } from "./insights-generator";
 import { transferAnalyzer } from "./transfer-analyzer";
 import { gameweekOptimizer } from "./gameweek-optimizer";
+import { gameweekPlanHydrator } from "./gameweek-plan-hydrator";
 import { z } from "zod";
 import { userSettingsSchema, multiWeekTransferPredictions, type MultiWeekTransferPrediction } from "@shared/schema";
 import { eq, desc } from "drizzle-orm";
@@ -268,7 +269,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       const user = await storage.getOrCreateUser(managerId);
       
-      const syncResult = await managerSync.syncManagerTeam(managerId, user.id);
+      const syncResult = await managerSync.syncManagerTeam(managerId, user.id, managerDetails);
       
       if (!syncResult.success) {
         return res.status(500).json({ error: syncResult.error || "Failed to sync team" });
@@ -820,7 +821,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
       const snapshot = await gameweekSnapshot.getSnapshot(rawPlan.gameweek);
       
       // Hydrate the plan with player names and calculated fields
-      const { gameweekPlanHydrator } = await import("./gameweek-plan-hydrator");
       const hydratedPlan = await gameweekPlanHydrator.hydratePlan(rawPlan, snapshot.data.players);
       
       // Add usingFallbackData flag based on dataSource column
@@ -858,7 +858,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
       const snapshot = await gameweekSnapshot.getSnapshot(latestGameweek);
       
       // Hydrate all plans with player names and calculated fields
-      const { gameweekPlanHydrator } = await import("./gameweek-plan-hydrator");
       const hydratedPlans = await gameweekPlanHydrator.hydratePlans(rawPlans, snapshot.data.players);
       
       res.json(hydratedPlans);
@@ -939,10 +938,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       console.log(`[Automation Plan Status Route] Updating plan ${planId} to status: ${status}`);
 
-      await storage.updateGameweekPlanStatus(planId, status);
-      
-      const updatedPlan = await storage.getGameweekPlanById(planId);
-      
+      const updatedPlan = await storage.updateGameweekPlanStatus(planId, status);
+
       if (!updatedPlan) {
         return res.status(404).json({ error: "Gameweek plan not found" });
       }
@@ -1068,8 +1065,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
         4: [], // FWD
       };
       
+      // Index once instead of a linear scan of the bootstrap list per squad slot
+      const allPlayersById = new Map(allPlayers.map(p => [p.id, p]));
+
       for (const playerId of finalSquad) {
-        const player = allPlayers.find(p => p.id === playerId);
+        const player = allPlayersById.get(playerId);
         if (!player) continue;
         
         const predictedPoints = predictionsMap.get(playerId) || 0;
@@ -1199,13 +1199,16 @@ export async function registerRoutes(app: Express): Promise<Server> {
         baselinePredictedPoints: plan.baselinePredictedPoints || Math.round(grossPredictedPoints), // Keep original baseline
       };
 
-      // Save the updated plan using storage methods
-      await storage.updateGameweekPlanTransfers(planId, updatedTransfers);
-      if (updatedLineupOptimizations.length > 0) {
-        await storage.updateGameweekPlanLineupOptimizations(planId, updatedLineupOptimizations);
-      }
-      await storage.updateGameweekPlanLineup(planId, lineup);
-      await storage.updateGameweekPlanPredictedPoints(planId, netPredictedPoints);
+      // Save the updated plan in a single UPDATE instead of one statement per
+      // field; an empty optimization list still means "leave the stored value"
+      await storage.updateGameweekPlanResults(planId, {
+        transfers: updatedTransfers,
+        ...(updatedLineupOptimizations.length > 0
+          ? { lineupOptimizations: updatedLineupOptimizations }
+          : {}),
+        lineup,
+        predictedPoints: netPredictedPoints,
+      });
 
       // Fetch the updated plan
       const finalPlan = await storage.getGameweekPlanById(planId);
@@ -1239,8 +1242,9 @@ export async function registerRoutes(app: Express): Promise<Server> {
       // Toggle the submitted status
       const newSubmittedStatus = !plan.submitted;
 
-      // Update the submitted field in the database
-      await storage.updateGameweekPlanSubmitted(planId, newSubmittedStatus);
+      // Update the submitted field in the database - the update returns the
+      // refreshed row, so no follow-up fetch is needed
+      const updatedPlan = await storage.updateGameweekPlanSubmitted(planId, newSubmittedStatus);
 
       // If marking as submitted (not un-submitting), record multi-week predictions
       if (newSubmittedStatus && plan.transfers && Array.isArray(plan.transfers) && plan.transfers.length > 0) {
@@ -1253,9 +1257,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
         );
       }
 
-      // Fetch the updated plan
-      const updatedPlan = await storage.getGameweekPlanById(planId);
-
       console.log(`[Mark Submitted Route] Plan ${planId} submitted status toggled to ${newSubmittedStatus}`);
       res.json(updatedPlan);
     } catch (error) {
@@ -1582,11 +1583,9 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       console.log(`[AI Impact Analysis Route] Fetching impact summary for user ${userId}`);
       
-      const allPlans = await storage.getGameweekPlansByUser(userId);
-      const analyzedPlans = allPlans.filter(plan => 
-        plan.analysisCompletedAt !== null && 
-        plan.pointsDelta !== null
-      );
+      // Narrow projection: the summary doesn't need lineups, reasoning, or
+      // team snapshots, and the analyzed filter runs in the query
+      const analyzedPlans = await storage.getAnalyzedPlanSummaries(userId);
 
       if (analyzedPlans.length === 0) {
         return res.json({
@@ -1657,10 +1656,12 @@ export async function registerRoutes(app: Express): Promise<Server> {
       const gameweek = planningGameweek?.id || 1;
       const snapshot = await gameweekSnapshot.getSnapshot(gameweek);
       const players = snapshot.data.players;
-      
+      // Index once - two linear scans of ~700 players per prediction row adds up
+      const playersById = new Map(players.map(p => [p.id, p]));
+
       const enrichedPredictions = predictions.map((pred: MultiWeekTransferPrediction) => {
-        const playerIn = players.find(p => p.id === pred.playerInId);
-        const playerOut = players.find(p => p.id === pred.playerOutId);
+        const playerIn = playersById.get(pred.playerInId);
+        const playerOut = playersById.get(pred.playerOutId);
         
         return {
           ...pred,
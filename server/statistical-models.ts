@@ -15,6 +15,59 @@ export interface StatisticalPredictionComponents {
   expectedMinutes: number;
 }
 
+// FPL scoring constants precomputed per position at module load, so the
+// per-prediction hot paths do a single object lookup instead of rebuilding
+// literals and re-evaluating chained ternaries on every call
+const POSITION_TYPES = ['GKP', 'DEF', 'MID', 'FWD'] as const;
+
+// log(k!) lookup for the Poisson kernel. Every distribution evaluates k in
+// 0..11, and the old loop re-summed logs on each call; the table covers any
+// realistic goals/assists/saves count with plenty of headroom.
+const LOG_FACTORIAL_TABLE: number[] = (() => {
+  const table = [0, 0];
+  for (let n = 2; n <= 32; n++) {
+    table.push(table[n - 1] + Math.log(n));
+  }
+  return table;
+})();
+
+export const POSITION_POINTS: Record<string, { goal: number; assist: number; cleanSheet: number; save: number }> = {
+  GKP: { goal: 6, assist: 3, cleanSheet: 4, save: 1 / 3 },
+  DEF: { goal: 6, assist: 3, cleanSheet: 4, save: 0 },
+  MID: { goal: 5, assist: 3, cleanSheet: 1, save: 0 },
+  FWD: { goal: 4, assist: 3, cleanSheet: 0, save: 0 },
+};
+
+// Scoring rules are fixed for the season, so specialize a straight-line
+// scorer per position up front with the point values captured as closure
+// constants, rather than re-reading the rule table inside every prediction
+const POSITION_SCORERS: Record<string, (components: StatisticalPredictionComponents, appearancePoints: number) => number> =
+  Object.fromEntries(
+    Object.entries(POSITION_POINTS).map(([position, points]) => [
+      position,
+      (components: StatisticalPredictionComponents, appearancePoints: number) =>
+        appearancePoints +
+        components.expectedGoals * points.goal +
+        components.expectedAssists * points.assist +
+        components.expectedCleanSheet * points.cleanSheet +
+        components.expectedSaves * points.save -
+        components.expectedYellowCard +
+        components.expectedBonus,
+    ])
+  );
+
+// Minutes-adjustment rules as prebuilt per-component closures, replacing a
+// cascade of string comparisons evaluated several times per prediction
+const MINUTES_ADJUSTMENTS: Record<string, (expectedMinutes: number) => number> = {
+  goals: m => m / 90,
+  assists: m => m / 90,
+  clean_sheet: m => (m >= 60 ? 1 : m / 60),
+  appearance: m => (m >= 60 ? 1 : m >= 1 ? 0.5 : 0),
+  bonus: m => m / 90,
+  yellow_card: m => m / 90,
+  saves: m => m / 90,
+};
+
 export class StatisticalModels {
   poissonProbability(lambda: number, k: number): number {
     if (lambda <= 0) return k === 0 ? 1 : 0;
@@ -25,8 +78,10 @@ export class StatisticalModels {
 
   private logFactorial(n: number): number {
     if (n <= 1) return 0;
-    let result = 0;
-    for (let i = 2; i <= n; i++) {
+    if (n < LOG_FACTORIAL_TABLE.length) return LOG_FACTORIAL_TABLE[n];
+
+    let result = LOG_FACTORIAL_TABLE[LOG_FACTORIAL_TABLE.length - 1];
+    for (let i = LOG_FACTORIAL_TABLE.length; i <= n; i++) {
       result += Math.log(i);
     }
     return result;
@@ -61,17 +116,40 @@ export class StatisticalModels {
     return this.poissonDistribution(adjustedXA, 4);
   }
 
+  // FPL strength ratings are small integers, so a (defense, attack, home)
+  // triple packs losslessly into a single number. Keyed purely by its
+  // inputs, the cache never goes stale and stays tiny (at most one entry
+  // per team pairing and venue), while every defender and keeper of a side
+  // facing the same opponent shares one Poisson evaluation.
+  private cleanSheetCache = new Map<number, number>();
+
+  private static packStrengthKey(
+    teamDefenseStrength: number,
+    opponentAttackStrength: number,
+    isHome: boolean
+  ): number {
+    return (teamDefenseStrength * 8192 + opponentAttackStrength) * 2 + (isHome ? 1 : 0);
+  }
+
   calculateCleanSheetProbability(
     teamDefenseStrength: number,
     opponentAttackStrength: number,
     isHome: boolean
   ): number {
+    const key = StatisticalModels.packStrengthKey(teamDefenseStrength, opponentAttackStrength, isHome);
+    const cached = this.cleanSheetCache.get(key);
+    if (cached !== undefined) {
+      return cached;
+    }
+
     const homeAdvantage = isHome ? 0.85 : 1.15;
     const expectedGoalsConceded = (opponentAttackStrength / teamDefenseStrength) * homeAdvantage;
 
     const poissonZero = this.poissonProbability(expectedGoalsConceded, 0);
 
-    return Math.max(0, Math.min(1, poissonZero));
+    const probability = Math.max(0, Math.min(1, poissonZero));
+    this.cleanSheetCache.set(key, probability);
+    return probability;
   }
 
   calculateExpectedSaves(
@@ -133,59 +211,20 @@ export class StatisticalModels {
   minutesAdjustmentFactor(expectedMinutes: number, component: string): number {
     if (expectedMinutes === 0) return 0;
 
-    if (component === 'goals' || component === 'assists') {
-      return expectedMinutes / 90;
-    }
-
-    if (component === 'clean_sheet') {
-      if (expectedMinutes >= 60) {
-        return 1;
-      } else {
-        return expectedMinutes / 60;
-      }
-    }
-
-    if (component === 'appearance') {
-      if (expectedMinutes >= 60) return 1;
-      if (expectedMinutes >= 1) return 0.5;
-      return 0;
-    }
-
-    if (component === 'bonus' || component === 'yellow_card' || component === 'saves') {
-      return expectedMinutes / 90;
-    }
-
-    return expectedMinutes / 90;
+    const adjust = MINUTES_ADJUSTMENTS[component];
+    return adjust ? adjust(expectedMinutes) : expectedMinutes / 90;
   }
 
   calculateExpectedPointsFromComponents(
     components: StatisticalPredictionComponents,
     position: string
   ): number {
-    const goalPoints = position === 'FWD' ? 4 : position === 'MID' ? 5 : 6;
-    const assistPoints = 3;
-    const cleanSheetPoints =
-      position === 'GKP' || position === 'DEF' ? 4 : position === 'MID' ? 1 : 0;
-    const savePoints = position === 'GKP' ? 1 / 3 : 0;
+    const scorer = POSITION_SCORERS[position] ?? POSITION_SCORERS.MID;
 
     const appearancePoints =
       this.minutesAdjustmentFactor(components.expectedMinutes, 'appearance') * 2;
 
-    const goalContribution = components.expectedGoals * goalPoints;
-    const assistContribution = components.expectedAssists * assistPoints;
-    const cleanSheetContribution = components.expectedCleanSheet * cleanSheetPoints;
-    const saveContribution = components.expectedSaves * savePoints;
-    const yellowCardPenalty = components.expectedYellowCard * -1;
-    const bonusContribution = components.expectedBonus;
-
-    const totalPoints =
-      appearancePoints +
-      goalContribution +
-      assistContribution +
-      cleanSheetContribution +
-      saveContribution +
-      yellowCardPenalty +
-      bonusContribution;
+    const totalPoints = scorer(components, appearancePoints);
 
     return Math.max(0, Math.round(totalPoints * 10) / 10);
   }
@@ -212,27 +251,53 @@ export class StatisticalModels {
   }
 
   getPositionFromType(elementType: number): string {
-    const positions = ['GKP', 'DEF', 'MID', 'FWD'];
-    return positions[elementType - 1] || 'MID';
+    return POSITION_TYPES[elementType - 1] || 'MID';
   }
 
+  // League-average strengths are recomputed for every player prediction even
+  // though the same teams array (from the bootstrap cache or a snapshot) is
+  // passed each time. Memoize per array identity; the WeakMap lets results
+  // die with the snapshot they came from.
+  private teamStrengthCache = new WeakMap<FPLTeam[], {
+    avgAttackHome: number;
+    avgAttackAway: number;
+    avgDefenseHome: number;
+    avgDefenseAway: number;
+  }>();
+
   normalizeTeamStrength(teams: FPLTeam[]): {
     avgAttackHome: number;
     avgAttackAway: number;
     avgDefenseHome: number;
     avgDefenseAway: number;
   } {
-    const avgAttackHome = teams.reduce((sum, t) => sum + t.strength_attack_home, 0) / teams.length;
-    const avgAttackAway = teams.reduce((sum, t) => sum + t.strength_attack_away, 0) / teams.length;
-    const avgDefenseHome = teams.reduce((sum, t) => sum + t.strength_defence_home, 0) / teams.length;
-    const avgDefenseAway = teams.reduce((sum, t) => sum + t.strength_defence_away, 0) / teams.length;
+    const cached = this.teamStrengthCache.get(teams);
+    if (cached) {
+      return cached;
+    }
 
-    return {
-      avgAttackHome,
-      avgAttackAway,
-      avgDefenseHome,
-      avgDefenseAway,
+    // Accumulate all four sums in a single pass over the teams array
+    let attackHome = 0;
+    let attackAway = 0;
+    let defenseHome = 0;
+    let defenseAway = 0;
+
+    for (const t of teams) {
+      attackHome += t.strength_attack_home;
+      attackAway += t.strength_attack_away;
+      defenseHome += t.strength_defence_home;
+      defenseAway += t.strength_defence_away;
+    }
+
+    const stats = {
+      avgAttackHome: attackHome / teams.length,
+      avgAttackAway: attackAway / teams.length,
+      avgDefenseHome: defenseHome / teams.length,
+      avgDefenseAway: defenseAway / teams.length,
     };
+
+    this.teamStrengthCache.set(teams, stats);
+    return stats;
   }
 
   calculateOpponentAdjustedXG(
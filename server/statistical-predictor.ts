@@ -1,5 +1,5 @@
-import { statisticalModels, type StatisticalPredictionComponents } from "./statistical-models";
-import { minutesEstimator } from "./minutes-estimator";
+import { statisticalModels, POSITION_POINTS, type StatisticalPredictionComponents } from "./statistical-models";
+import { minutesEstimator, type MinutesProbability } from "./minutes-estimator";
 import type { FPLPlayer, FPLTeam, FPLFixture, Prediction } from "@shared/schema";
 
 interface StatisticalPredictionContext {
@@ -37,10 +37,26 @@ export interface DetailedPrediction {
 }
 
 export class StatisticalPredictorService {
+  // Team lookups by id, memoized per teams-array identity. Batch callers
+  // pass the same bootstrap team list for every player and fixture, so the
+  // id index is built once per list instead of scanning the array twice
+  // per prediction
+  private teamsByIdCache = new WeakMap<FPLTeam[], Map<number, FPLTeam>>();
+
+  private getTeamsById(allTeams: FPLTeam[]): Map<number, FPLTeam> {
+    let teamsById = this.teamsByIdCache.get(allTeams);
+    if (!teamsById) {
+      teamsById = new Map(allTeams.map(t => [t.id, t]));
+      this.teamsByIdCache.set(allTeams, teamsById);
+    }
+    return teamsById;
+  }
+
   async predictPlayerPointsStatistical(
     player: FPLPlayer,
     upcomingFixtures: FPLFixture[],
-    allTeams: FPLTeam[]
+    allTeams: FPLTeam[],
+    preloadedMinutes?: MinutesProbability
   ): Promise<DetailedPrediction> {
     const position = statisticalModels.getPositionFromType(player.element_type);
     const isDefensive = position === 'GKP' || position === 'DEF';
@@ -50,16 +66,17 @@ export class StatisticalPredictorService {
     }
 
     const nextFixture = upcomingFixtures[0];
-    const playerTeam = allTeams.find(t => t.id === player.team);
+    const teamsById = this.getTeamsById(allTeams);
+    const playerTeam = teamsById.get(player.team);
     const isHome = nextFixture.team_h === player.team;
     const opponentTeamId = isHome ? nextFixture.team_a : nextFixture.team_h;
-    const opponentTeam = allTeams.find(t => t.id === opponentTeamId);
+    const opponentTeam = teamsById.get(opponentTeamId);
 
     if (!playerTeam || !opponentTeam) {
       return this.createZeroPrediction(player, position, 'Team data unavailable');
     }
 
-    const minutesProb = await minutesEstimator.estimateMinutes(player);
+    const minutesProb = preloadedMinutes ?? await minutesEstimator.estimateMinutes(player);
 
     if (minutesProb.expectedMinutes === 0) {
       return this.createZeroPrediction(
@@ -206,11 +223,8 @@ export class StatisticalPredictorService {
     components: StatisticalPredictionComponents,
     position: string
   ): DetailedPrediction['breakdown'] {
-    const goalPoints = position === 'FWD' ? 4 : position === 'MID' ? 5 : 6;
-    const assistPoints = 3;
-    const cleanSheetPoints =
-      position === 'GKP' || position === 'DEF' ? 4 : position === 'MID' ? 1 : 0;
-    const savePoints = position === 'GKP' ? 1 / 3 : 0;
+    const { goal: goalPoints, assist: assistPoints, cleanSheet: cleanSheetPoints, save: savePoints } =
+      POSITION_POINTS[position] ?? POSITION_POINTS.MID;
 
     const appearance = statisticalModels.minutesAdjustmentFactor(components.expectedMinutes, 'appearance') * 2;
 
@@ -303,7 +317,8 @@ export class StatisticalPredictorService {
     player: FPLPlayer,
     upcomingFixtures: FPLFixture[],
     allTeams: FPLTeam[],
-    numGameweeks: number
+    numGameweeks: number,
+    preloadedMinutes?: MinutesProbability
   ): Promise<{ totalPoints: number; fixtures: DetailedPrediction[] }> {
     // Limit to the requested number of gameweeks
     const fixturestoConsider = upcomingFixtures.slice(0, numGameweeks);
@@ -318,12 +333,17 @@ export class StatisticalPredictorService {
     const predictions: DetailedPrediction[] = [];
     let totalPoints = 0;
 
+    // Minutes expectation is fixture-independent, so estimate once instead
+    // of re-querying the player's history for every gameweek
+    const minutesProb = preloadedMinutes ?? await minutesEstimator.estimateMinutes(player);
+
     // Predict for each fixture individually
     for (const fixture of fixturestoConsider) {
       const prediction = await this.predictPlayerPointsStatistical(
         player,
         [fixture],
-        allTeams
+        allTeams,
+        minutesProb
       );
       predictions.push(prediction);
       totalPoints += prediction.predicted_points;
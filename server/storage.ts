@@ -2,7 +2,7 @@ import "dotenv/config";
 import { drizzle } from "drizzle-orm/neon-serverless";
 import { Pool, neonConfig } from "@neondatabase/serverless";
 import ws from "ws";
-import { eq, and, desc, gt, lte, isNull } from "drizzle-orm";
+import { eq, and, desc, gt, lte, isNull, isNotNull, inArray, sql, getTableColumns } from "drizzle-orm";
 import {
   users,
   userSettingsTable,
@@ -64,20 +64,117 @@ import {
   type InsertAppliedLineup,
 } from "@shared/schema";
 
-if (!process.env.DATABASE_URL) {
+// Vitest sets VITEST in the environment. The pure-logic test suites import
+// this module transitively but never touch the database, so under the test
+// runner a placeholder connection string stands in for DATABASE_URL: the
+// pool only dials on first query, so tests run in sandboxes with no
+// database configured while any accidental query still fails loudly.
+const connectionString =
+  process.env.DATABASE_URL ??
+  (process.env.VITEST ? "postgres://vitest@localhost:5432/vitest" : undefined);
+
+if (!connectionString) {
   throw new Error("DATABASE_URL environment variable is not set");
 }
 
 neonConfig.webSocketConstructor = ws;
 neonConfig.wsProxy = (host) => `${host}?sslmode=require`;
 const pool = new Pool({
-  connectionString: process.env.DATABASE_URL,
+  connectionString,
   ssl: {
     rejectUnauthorized: false
-  }
+  },
+  // Keep a bounded pool of warm connections: sync jobs and the scheduler fan
+  // out bursts of queries, and re-opening a websocket-tunnelled connection
+  // per burst costs a TLS + websocket handshake each time
+  max: 10,
+  idleTimeoutMillis: 30_000,
+  connectionTimeoutMillis: 10_000,
+});
+
+// Idle pooled connections ride a websocket tunnel that the Neon proxy can
+// drop at any time; without a handler that error is fatal to the process.
+// Log and let the pool discard the dead connection - the next checkout
+// dials a fresh one (the pooled equivalent of pre-ping).
+pool.on("error", (err) => {
+  console.error("[Storage] Idle database connection error (will reconnect on next use):", err.message);
 });
+
 export const db = drizzle(pool);
 
+// Prepared statements for the hottest point lookups. Built once at module
+// load so repeated calls skip SQL generation and reuse the same query plan.
+const getFplCredentialsQuery = db
+  .select()
+  .from(fplCredentials)
+  .where(eq(fplCredentials.userId, sql.placeholder("userId")))
+  .limit(1)
+  .prepare("get_fpl_credentials_by_user");
+
+const getTeamQuery = db
+  .select()
+  .from(userTeams)
+  .where(and(
+    eq(userTeams.userId, sql.placeholder("userId")),
+    eq(userTeams.gameweek, sql.placeholder("gameweek"))
+  ))
+  .limit(1)
+  .prepare("get_team_by_user_gameweek");
+
+// Narrow projection of player_minutes_history carrying only the columns the
+// minutes estimator reads, so the history queries skip the wide row
+export type PlayerMinutesWindow = Pick<PlayerMinutesHistory, 'playerId' | 'gameweek' | 'minutesPlayed'>;
+
+// Fields that gameweek analysis computes for an existing plan row. The
+// analyzer collects these as it runs and flushes them in a single UPDATE via
+// updateGameweekPlanResults instead of issuing one statement per field.
+export interface GameweekPlanResultUpdates {
+  transfers?: Array<{
+    player_out_id: number;
+    player_in_id: number;
+    player_out_predicted_points?: number;
+    player_in_predicted_points?: number;
+    expected_points_gain: number;
+    expected_points_gain_timeframe: string;
+    reasoning: string;
+    priority: 'high' | 'medium' | 'low';
+    cost_impact: number;
+    accepted?: boolean;
+    substitution_details?: {
+      benched_player_id: number;
+      benched_player_name: string;
+      benched_player_position: string;
+      benched_player_predicted_points: number;
+      incoming_player_name: string;
+      incoming_player_position: string;
+      incoming_player_predicted_points: number;
+      bench_reason: string;
+    };
+  }>;
+  lineupOptimizations?: Array<{
+    benched_player_id: number;
+    benched_player_name: string;
+    benched_player_position: string;
+    benched_player_predicted_points: number;
+    starting_player_id: number;
+    starting_player_name: string;
+    starting_player_position: string;
+    starting_player_predicted_points: number;
+    reasoning: string;
+    accepted?: boolean;
+  }>;
+  reasoning?: string;
+  lineup?: Array<{
+    player_id: number;
+    position: number;
+    is_captain: boolean;
+    is_vice_captain: boolean;
+    multiplier: number;
+  }>;
+  predictedPoints?: number;
+  baselinePredictedPoints?: number;
+}
+
 export interface IStorage {
   getOrCreateUser(fplManagerId: number): Promise<User>;
   getUserSettings(userId: number): Promise<UserSettings | undefined>;
@@ -87,16 +184,20 @@ export interface IStorage {
   
   saveTeam(team: InsertUserTeam): Promise<UserTeam>;
   getTeam(userId: number, gameweek: number): Promise<UserTeam | undefined>;
+  getTeamsByGameweeks(userId: number, gameweeks: number[]): Promise<UserTeam[]>;
   getTeamsByUser(userId: number): Promise<UserTeam[]>;
   
   savePrediction(prediction: InsertPrediction): Promise<PredictionDB>;
   upsertPrediction(prediction: InsertPrediction): Promise<void>;
+  upsertPredictions(predictionRows: InsertPrediction[]): Promise<void>;
   getPredictions(userId: number, gameweek: number): Promise<PredictionDB[]>;
   getPredictionsByGameweek(userId: number, gameweek: number): Promise<PredictionDB[]>;
+  getPredictionsBySnapshot(userId: number, gameweek: number, snapshotId: string): Promise<PredictionDB[]>;
   getPredictionsByUser(userId: number): Promise<PredictionDB[]>;
   getPredictionsWithoutActuals(userId: number, gameweek: number): Promise<PredictionDB[]>;
   updatePredictionActualPoints(predictionId: number, actualPoints: number): Promise<void>;
   updateActualPointsByPlayer(userId: number, gameweek: number, playerId: number, actualPoints: number): Promise<void>;
+  bulkUpdateActualPoints(userId: number, gameweek: number, updates: Array<{ playerId: number; actualPoints: number }>): Promise<void>;
   deletePredictionsByGameweek(userId: number, gameweek: number): Promise<void>;
   
   saveTransfer(transfer: InsertTransfer): Promise<Transfer>;
@@ -131,7 +232,10 @@ export interface IStorage {
   getGameweekPlanById(planId: number): Promise<GameweekPlan | undefined>;
   getLatestGameweekPlan(userId: number): Promise<GameweekPlan | undefined>;
   getGameweekPlansByUser(userId: number): Promise<GameweekPlan[]>;
-  updateGameweekPlanStatus(planId: number, status: 'pending' | 'previewed' | 'applied' | 'rejected'): Promise<void>;
+  getAnalyzedPlanSummaries(userId: number): Promise<Array<Pick<GameweekPlan,
+    'id' | 'gameweek' | 'status' | 'captainId' | 'transfers' | 'pointsDelta' |
+    'actualPointsWithAI' | 'actualPointsWithoutAI' | 'analysisCompletedAt'>>>;
+  updateGameweekPlanStatus(planId: number, status: 'pending' | 'previewed' | 'applied' | 'rejected'): Promise<GameweekPlan | undefined>;
   updateGameweekPlanActualPoints(planId: number, actualPoints: number): Promise<void>;
   updateGameweekPlanAnalysis(planId: number, analysis: {
     actualPointsWithAI: number;
@@ -160,7 +264,8 @@ export interface IStorage {
     starting_player_predicted_points: number;
     reasoning: string;
   }>): Promise<void>;
-  updateGameweekPlanSubmitted(planId: number, submitted: boolean): Promise<void>;
+  updateGameweekPlanResults(planId: number, updates: GameweekPlanResultUpdates): Promise<void>;
+  updateGameweekPlanSubmitted(planId: number, submitted: boolean): Promise<GameweekPlan | undefined>;
 
   // Change History
   saveChangeHistory(change: InsertChangeHistory): Promise<ChangeHistory>;
@@ -169,6 +274,7 @@ export interface IStorage {
 
   // AI Precomputations
   savePrecomputation(data: InsertAiPrecomputation): Promise<void>;
+  savePrecomputations(data: InsertAiPrecomputation[]): Promise<void>;
   getPrecomputation(
     snapshotId: string,
     computationType: string,
@@ -229,7 +335,17 @@ export class PostgresStorage implements IStorage {
     };
   }
 
+  // fplManagerId -> user rows are immutable once created (id, fplManagerId,
+  // createdAt only), so the mapping can be cached in-process indefinitely.
+  // Nearly every manager endpoint resolves the same handful of ids.
+  private userCacheByManagerId = new Map<number, User>();
+
   async getOrCreateUser(fplManagerId: number): Promise<User> {
+    const cached = this.userCacheByManagerId.get(fplManagerId);
+    if (cached) {
+      return cached;
+    }
+
     const existingUsers = await db
       .select()
       .from(users)
@@ -237,6 +353,7 @@ export class PostgresStorage implements IStorage {
       .limit(1);
 
     if (existingUsers.length > 0) {
+      this.userCacheByManagerId.set(fplManagerId, existingUsers[0]);
       return existingUsers[0];
     }
 
@@ -245,6 +362,7 @@ export class PostgresStorage implements IStorage {
       .values({ fplManagerId })
       .returning();
 
+    this.userCacheByManagerId.set(fplManagerId, newUsers[0]);
     return newUsers[0];
   }
 
@@ -285,6 +403,27 @@ export class PostgresStorage implements IStorage {
     }));
   }
 
+  // Single source of truth for the snake_case API <-> camelCase DB field
+  // mapping, so the save/read paths do one table-driven pass instead of
+  // repeating five hasOwnProperty probes per branch
+  private static readonly SETTINGS_FIELD_MAP = [
+    ['manager_id', 'managerId'],
+    ['primary_league_id', 'primaryLeagueId'],
+    ['risk_tolerance', 'riskTolerance'],
+    ['auto_captain', 'autoCaptain'],
+    ['notifications_enabled', 'notificationsEnabled'],
+  ] as const;
+
+  private pickProvidedSettings(settings: UserSettings): Partial<typeof userSettingsTable.$inferInsert> {
+    const dbSettings: Record<string, unknown> = {};
+    for (const [apiKey, dbKey] of PostgresStorage.SETTINGS_FIELD_MAP) {
+      if (Object.prototype.hasOwnProperty.call(settings, apiKey)) {
+        dbSettings[dbKey] = (settings as Record<string, unknown>)[apiKey];
+      }
+    }
+    return dbSettings;
+  }
+
   async saveUserSettings(userId: number, settings: UserSettings): Promise<UserSettings> {
     // Check if settings exist in DB
     const existingSettings = await db
@@ -293,45 +432,46 @@ export class PostgresStorage implements IStorage {
       .where(eq(userSettingsTable.userId, userId))
       .limit(1);
 
+    const provided = this.pickProvidedSettings(settings);
     let result: UserSettingsTable;
-    
-    if (existingSettings.length > 0) {
-      // UPDATE: Only set explicitly provided fields to preserve partial updates
-      const dbSettings: Partial<typeof userSettingsTable.$inferInsert> = {};
-      
-      if (settings.hasOwnProperty('manager_id')) dbSettings.managerId = settings.manager_id;
-      if (settings.hasOwnProperty('primary_league_id')) dbSettings.primaryLeagueId = settings.primary_league_id;
-      if (settings.hasOwnProperty('risk_tolerance')) dbSettings.riskTolerance = settings.risk_tolerance;
-      if (settings.hasOwnProperty('auto_captain')) dbSettings.autoCaptain = settings.auto_captain;
-      if (settings.hasOwnProperty('notifications_enabled')) dbSettings.notificationsEnabled = settings.notifications_enabled;
-
-      const updated = await db
-        .update(userSettingsTable)
-        .set(dbSettings)
-        .where(eq(userSettingsTable.userId, userId))
-        .returning();
 
-      result = updated[0];
+    if (existingSettings.length > 0) {
+      const existing = existingSettings[0];
+
+      // UPDATE: Only set explicitly provided fields that actually differ from
+      // the stored row, and skip the UPDATE entirely when nothing changed -
+      // most settings saves are no-ops re-submitting the current values
+      const dbSettings: Record<string, unknown> = {};
+      for (const [key, value] of Object.entries(provided)) {
+        if (value !== (existing as Record<string, unknown>)[key]) {
+          dbSettings[key] = value;
+        }
+      }
+
+      if (Object.keys(dbSettings).length === 0) {
+        result = existing;
+      } else {
+        const updated = await db
+          .update(userSettingsTable)
+          .set(dbSettings)
+          .where(eq(userSettingsTable.userId, userId))
+          .returning();
+
+        result = updated[0];
+      }
     } else {
-      // INSERT: Set all defaults + overrides for new records
-      const dbSettings: Partial<typeof userSettingsTable.$inferInsert> = {
-        riskTolerance: 'balanced',
-        autoCaptain: false,
-        notificationsEnabled: false,
-        managerId: null,
-        primaryLeagueId: null,
-      };
-
-      // Override with any explicitly provided values
-      if (settings.hasOwnProperty('manager_id')) dbSettings.managerId = settings.manager_id;
-      if (settings.hasOwnProperty('primary_league_id')) dbSettings.primaryLeagueId = settings.primary_league_id;
-      if (settings.hasOwnProperty('risk_tolerance')) dbSettings.riskTolerance = settings.risk_tolerance;
-      if (settings.hasOwnProperty('auto_captain')) dbSettings.autoCaptain = settings.auto_captain;
-      if (settings.hasOwnProperty('notifications_enabled')) dbSettings.notificationsEnabled = settings.notifications_enabled;
-
+      // INSERT: Set all defaults, overridden by any explicitly provided values
       const inserted = await db
         .insert(userSettingsTable)
-        .values({ userId, ...dbSettings })
+        .values({
+          userId,
+          riskTolerance: 'balanced',
+          autoCaptain: false,
+          notificationsEnabled: false,
+          managerId: null,
+          primaryLeagueId: null,
+          ...provided,
+        })
         .returning();
 
       result = inserted[0];
@@ -357,45 +497,49 @@ export class PostgresStorage implements IStorage {
   }
 
   async saveTeam(team: InsertUserTeam): Promise<UserTeam> {
-    const existingTeam = await this.getTeam(team.userId, team.gameweek);
-
     const teamData = {
       ...team,
       players: team.players as { player_id: number | null; position: number; is_captain: boolean; is_vice_captain: boolean; }[]
     };
 
-    if (existingTeam) {
-      const updated = await db
-        .update(userTeams)
-        .set(teamData)
-        .where(and(
-          eq(userTeams.userId, team.userId),
-          eq(userTeams.gameweek, team.gameweek)
-        ))
-        .returning();
-
-      return updated[0];
-    } else {
-      const inserted = await db
-        .insert(userTeams)
-        .values(teamData)
-        .returning();
+    // Single upsert against the (userId, gameweek) unique index instead of
+    // a SELECT followed by a separate INSERT or UPDATE roundtrip
+    const result = await db
+      .insert(userTeams)
+      .values(teamData)
+      .onConflictDoUpdate({
+        target: [userTeams.userId, userTeams.gameweek],
+        set: {
+          players: teamData.players,
+          formation: team.formation,
+          teamValue: team.teamValue,
+          bank: team.bank,
+          transfersMade: team.transfersMade,
+          lastDeadlineBank: team.lastDeadlineBank,
+          updatedAt: sql`now()`,
+        },
+      })
+      .returning();
 
-      return inserted[0];
-    }
+    return result[0];
   }
 
   async getTeam(userId: number, gameweek: number): Promise<UserTeam | undefined> {
-    const teams = await db
+    const teams = await getTeamQuery.execute({ userId, gameweek });
+    return teams[0];
+  }
+
+  async getTeamsByGameweeks(userId: number, gameweeks: number[]): Promise<UserTeam[]> {
+    if (gameweeks.length === 0) return [];
+
+    // One indexed IN-query instead of a separate SELECT per gameweek
+    return db
       .select()
       .from(userTeams)
       .where(and(
         eq(userTeams.userId, userId),
-        eq(userTeams.gameweek, gameweek)
-      ))
-      .limit(1);
-
-    return teams[0];
+        inArray(userTeams.gameweek, gameweeks)
+      ));
   }
 
   async getTeamsByUser(userId: number): Promise<UserTeam[]> {
@@ -429,6 +573,23 @@ export class PostgresStorage implements IStorage {
       });
   }
 
+  async upsertPredictions(predictionRows: InsertPrediction[]): Promise<void> {
+    if (predictionRows.length === 0) return;
+
+    // One multi-row upsert for the whole batch instead of a roundtrip per player
+    await db
+      .insert(predictions)
+      .values(predictionRows)
+      .onConflictDoUpdate({
+        target: [predictions.userId, predictions.gameweek, predictions.playerId],
+        set: {
+          predictedPoints: sql`excluded.predicted_points`,
+          confidence: sql`excluded.confidence`,
+          snapshotId: sql`excluded.snapshot_id`,
+        },
+      });
+  }
+
   async getPredictions(userId: number, gameweek: number): Promise<PredictionDB[]> {
     return db
       .select()
@@ -449,6 +610,17 @@ export class PostgresStorage implements IStorage {
       ));
   }
 
+  async getPredictionsBySnapshot(userId: number, gameweek: number, snapshotId: string): Promise<PredictionDB[]> {
+    return db
+      .select()
+      .from(predictions)
+      .where(and(
+        eq(predictions.userId, userId),
+        eq(predictions.gameweek, gameweek),
+        eq(predictions.snapshotId, snapshotId)
+      ));
+  }
+
   async getPredictionsByUser(userId: number): Promise<PredictionDB[]> {
     return db
       .select()
@@ -523,7 +695,6 @@ export class PostgresStorage implements IStorage {
   }
 
   async getPredictionsWithoutActuals(userId: number, gameweek: number): Promise<PredictionDB[]> {
-    const { isNull } = await import("drizzle-orm");
     return db
       .select()
       .from(predictions)
@@ -545,6 +716,29 @@ export class PostgresStorage implements IStorage {
       ));
   }
 
+  async bulkUpdateActualPoints(
+    userId: number,
+    gameweek: number,
+    updates: Array<{ playerId: number; actualPoints: number }>
+  ): Promise<void> {
+    if (updates.length === 0) return;
+
+    // One UPDATE with a CASE over player IDs instead of a statement per player
+    const actualPointsCase = sql<number>`case ${sql.join(
+      updates.map(u => sql`when ${predictions.playerId} = ${u.playerId} then ${u.actualPoints}`),
+      sql` `
+    )} end`;
+
+    await db
+      .update(predictions)
+      .set({ actualPoints: actualPointsCase })
+      .where(and(
+        eq(predictions.userId, userId),
+        eq(predictions.gameweek, gameweek),
+        inArray(predictions.playerId, updates.map(u => u.playerId))
+      ));
+  }
+
   async deletePredictionsByGameweek(userId: number, gameweek: number): Promise<void> {
     await db
       .delete(predictions)
@@ -617,10 +811,7 @@ export class PostgresStorage implements IStorage {
     if (existingCreds) {
       const updated = await db
         .update(fplCredentials)
-        .set({
-          ...credentials,
-          updatedAt: new Date(),
-        })
+        .set(credentials)
         .where(eq(fplCredentials.userId, credentials.userId))
         .returning();
 
@@ -636,22 +827,14 @@ export class PostgresStorage implements IStorage {
   }
 
   async getFplCredentials(userId: number): Promise<FplCredentials | undefined> {
-    const results = await db
-      .select()
-      .from(fplCredentials)
-      .where(eq(fplCredentials.userId, userId))
-      .limit(1);
-
+    const results = await getFplCredentialsQuery.execute({ userId });
     return results[0];
   }
 
   async updateFplCredentials(userId: number, credentials: Partial<InsertFplCredentials>): Promise<FplCredentials> {
     const updated = await db
       .update(fplCredentials)
-      .set({
-        ...credentials,
-        updatedAt: new Date(),
-      })
+      .set(credentials)
       .where(eq(fplCredentials.userId, userId))
       .returning();
 
@@ -688,10 +871,7 @@ export class PostgresStorage implements IStorage {
     if (existingSettings) {
       const updated = await db
         .update(automationSettings)
-        .set({
-          ...settings,
-          updatedAt: new Date(),
-        })
+        .set(settings)
         .where(eq(automationSettings.userId, userId))
         .returning();
 
@@ -771,14 +951,55 @@ export class PostgresStorage implements IStorage {
     return results.map(plan => this.addAcceptedDefaults(plan));
   }
 
-  async updateGameweekPlanStatus(planId: number, status: 'pending' | 'previewed' | 'applied' | 'rejected'): Promise<void> {
-    await db
+  async getAnalyzedPlanSummaries(userId: number): Promise<Array<Pick<GameweekPlan,
+    'id' | 'gameweek' | 'status' | 'captainId' | 'transfers' | 'pointsDelta' |
+    'actualPointsWithAI' | 'actualPointsWithoutAI' | 'analysisCompletedAt'>>> {
+    // Impact summaries only read a few scalar fields plus the transfers list;
+    // select just those instead of dragging every plan's lineup, reasoning,
+    // and original-team snapshot JSON across the wire
+    const results = await db
+      .select({
+        id: gameweekPlans.id,
+        gameweek: gameweekPlans.gameweek,
+        status: gameweekPlans.status,
+        captainId: gameweekPlans.captainId,
+        transfers: gameweekPlans.transfers,
+        pointsDelta: gameweekPlans.pointsDelta,
+        actualPointsWithAI: gameweekPlans.actualPointsWithAI,
+        actualPointsWithoutAI: gameweekPlans.actualPointsWithoutAI,
+        analysisCompletedAt: gameweekPlans.analysisCompletedAt,
+      })
+      .from(gameweekPlans)
+      .where(and(
+        eq(gameweekPlans.userId, userId),
+        isNotNull(gameweekPlans.analysisCompletedAt),
+        isNotNull(gameweekPlans.pointsDelta)
+      ))
+      .orderBy(gameweekPlans.gameweek);
+
+    // Same defensive 'accepted' default as addAcceptedDefaults for legacy rows
+    return results.map(plan => ({
+      ...plan,
+      transfers: (plan.transfers as any[])?.map(t => ({
+        ...t,
+        accepted: t.accepted ?? true
+      })) || [],
+    }));
+  }
+
+  async updateGameweekPlanStatus(planId: number, status: 'pending' | 'previewed' | 'applied' | 'rejected'): Promise<GameweekPlan | undefined> {
+    // RETURNING hands back the updated row, so callers don't need a
+    // follow-up SELECT to render the result
+    const updated = await db
       .update(gameweekPlans)
-      .set({ 
+      .set({
         status,
         appliedAt: status === 'applied' ? new Date() : undefined,
       })
-      .where(eq(gameweekPlans.id, planId));
+      .where(eq(gameweekPlans.id, planId))
+      .returning();
+
+    return updated[0] ? this.addAcceptedDefaults(updated[0]) : undefined;
   }
 
   async updateGameweekPlanActualPoints(planId: number, actualPoints: number): Promise<void> {
@@ -939,14 +1160,79 @@ export class PostgresStorage implements IStorage {
       .where(eq(gameweekPlans.id, planId));
   }
 
-  async updateGameweekPlanSubmitted(planId: number, submitted: boolean): Promise<void> {
+  async updateGameweekPlanResults(planId: number, updates: GameweekPlanResultUpdates): Promise<void> {
+    const set: Record<string, any> = {};
+
+    if (updates.transfers) {
+      // Same accepted/predicted-points defaults as updateGameweekPlanTransfers
+      set.transfers = updates.transfers.map(t => ({
+        ...t,
+        accepted: t.accepted ?? true,
+        player_out_predicted_points: t.player_out_predicted_points ?? 0,
+        player_in_predicted_points: t.player_in_predicted_points ?? 0,
+      }));
+    }
+
+    if (updates.lineupOptimizations) {
+      set.lineupOptimizations = updates.lineupOptimizations.map(lo => ({
+        ...lo,
+        accepted: lo.accepted ?? true,
+      }));
+    }
+
+    if (updates.lineup) {
+      set.lineup = updates.lineup;
+    }
+
+    if (updates.predictedPoints !== undefined) {
+      set.predictedPoints = updates.predictedPoints;
+    }
+
+    if (updates.baselinePredictedPoints !== undefined) {
+      set.baselinePredictedPoints = updates.baselinePredictedPoints;
+    }
+
+    if (updates.reasoning !== undefined) {
+      // Same read-modify-write as updateGameweekPlanReasoning: only the
+      // reasoning field inside the aiReasoning JSON is replaced
+      const [plan] = await db
+        .select({ aiReasoning: gameweekPlans.aiReasoning })
+        .from(gameweekPlans)
+        .where(eq(gameweekPlans.id, planId));
+
+      if (plan?.aiReasoning) {
+        const existingReasoning = typeof plan.aiReasoning === 'string'
+          ? JSON.parse(plan.aiReasoning)
+          : plan.aiReasoning;
+
+        set.aiReasoning = JSON.stringify({
+          ...existingReasoning,
+          reasoning: updates.reasoning,
+        });
+      }
+    }
+
+    if (Object.keys(set).length === 0) {
+      return;
+    }
+
     await db
       .update(gameweekPlans)
-      .set({ 
+      .set(set)
+      .where(eq(gameweekPlans.id, planId));
+  }
+
+  async updateGameweekPlanSubmitted(planId: number, submitted: boolean): Promise<GameweekPlan | undefined> {
+    const updated = await db
+      .update(gameweekPlans)
+      .set({
         submitted,
         submittedAt: submitted ? new Date() : null
       })
-      .where(eq(gameweekPlans.id, planId));
+      .where(eq(gameweekPlans.id, planId))
+      .returning();
+
+    return updated[0] ? this.addAcceptedDefaults(updated[0]) : undefined;
   }
 
   async saveChangeHistory(change: InsertChangeHistory): Promise<ChangeHistory> {
@@ -986,6 +1272,27 @@ export class PostgresStorage implements IStorage {
     await db.insert(aiPrecomputations).values(insertData);
   }
 
+  async savePrecomputations(data: InsertAiPrecomputation[]): Promise<void> {
+    if (data.length === 0) return;
+
+    const insertData = data.map(entry => {
+      const row: any = { ...entry };
+      if (row.playerId === null || row.playerId === undefined) {
+        delete row.playerId;
+      }
+      return row;
+    });
+    // Prune expired rows and write the fresh batch in one transaction: a
+    // single batched DELETE plus a single multi-row INSERT per snapshot,
+    // instead of leaving stale rows for a separate cleanup pass
+    await db.transaction(async (tx) => {
+      await tx
+        .delete(aiPrecomputations)
+        .where(lte(aiPrecomputations.expiresAt, new Date()));
+      await tx.insert(aiPrecomputations).values(insertData);
+    });
+  }
+
   async getPrecomputation(
     snapshotId: string,
     computationType: string,
@@ -1164,37 +1471,24 @@ export class PostgresStorage implements IStorage {
     averageError: number,
     byPriceTier: { tier: string, avgError: number }[]
   }> {
-    const completedPredictions = await db
-      .select()
+    // Aggregate in the database - one row of stats back instead of every
+    // completed prediction row summed in JS
+    const [stats] = await db
+      .select({
+        totalPredictions: sql<number>`count(*)::int`,
+        averageAccuracyPercent: sql<number>`coalesce(avg(coalesce(${multiWeekTransferPredictions.accuracyPercent}, 0)), 0)`,
+        averageError: sql<number>`coalesce(avg(abs(coalesce(${multiWeekTransferPredictions.actualGainFinal}, 0) - ${multiWeekTransferPredictions.predictedGain})), 0)`,
+      })
       .from(multiWeekTransferPredictions)
       .where(and(
         eq(multiWeekTransferPredictions.userId, userId),
         eq(multiWeekTransferPredictions.status, 'completed')
       ));
 
-    if (completedPredictions.length === 0) {
-      return {
-        totalPredictions: 0,
-        averageAccuracyPercent: 0,
-        averageError: 0,
-        byPriceTier: []
-      };
-    }
-
-    const totalPredictions = completedPredictions.length;
-    
-    const totalAccuracy = completedPredictions.reduce((sum, pred) => 
-      sum + (pred.accuracyPercent || 0), 0);
-    const averageAccuracyPercent = totalAccuracy / totalPredictions;
-
-    const totalError = completedPredictions.reduce((sum, pred) => 
-      sum + Math.abs((pred.actualGainFinal || 0) - pred.predictedGain), 0);
-    const averageError = totalError / totalPredictions;
-
     return {
-      totalPredictions,
-      averageAccuracyPercent,
-      averageError,
+      totalPredictions: stats?.totalPredictions ?? 0,
+      averageAccuracyPercent: Number(stats?.averageAccuracyPercent ?? 0),
+      averageError: Number(stats?.averageError ?? 0),
       byPriceTier: []
     };
   }
@@ -1216,7 +1510,7 @@ export class PostgresStorage implements IStorage {
       .values({ jobName, lastRunAt })
       .onConflictDoUpdate({
         target: schedulerState.jobName,
-        set: { lastRunAt, updatedAt: new Date() }
+        set: { lastRunAt, updatedAt: sql`now()` }
       });
   }
 
@@ -1233,13 +1527,37 @@ export class PostgresStorage implements IStorage {
           meanBias: metrics.meanBias,
           rootMeanSquareError: metrics.rootMeanSquareError,
           calibrationFactor: metrics.calibrationFactor,
-          updatedAt: new Date()
+          updatedAt: sql`now()`
         }
       })
       .returning();
     return result[0];
   }
 
+  // Conflict update shared by the bias-metrics upsert paths; values come from
+  // the excluded row, so the clause is row-independent
+  private static readonly BIAS_METRICS_CONFLICT_SET = {
+    sampleSize: sql`excluded.sample_size`,
+    meanAbsoluteError: sql`excluded.mean_absolute_error`,
+    meanBias: sql`excluded.mean_bias`,
+    rootMeanSquareError: sql`excluded.root_mean_square_error`,
+    calibrationFactor: sql`excluded.calibration_factor`,
+    updatedAt: sql`now()`
+  };
+
+  async savePredictionBiasMetricsBatch(metricsRows: InsertPredictionBiasMetrics[]): Promise<void> {
+    if (metricsRows.length === 0) return;
+
+    // One multi-row upsert for all positions instead of a roundtrip per row
+    await db
+      .insert(predictionBiasMetrics)
+      .values(metricsRows)
+      .onConflictDoUpdate({
+        target: [predictionBiasMetrics.gameweek, predictionBiasMetrics.position],
+        set: PostgresStorage.BIAS_METRICS_CONFLICT_SET
+      });
+  }
+
   async getLatestBiasMetrics(): Promise<PredictionBiasMetrics[]> {
     const latestGameweek = await db
       .select()
@@ -1284,52 +1602,159 @@ export class PostgresStorage implements IStorage {
     return result[0];
   }
 
-  async getPlayerMinutesHistory(playerId: number, limit: number = 10): Promise<PlayerMinutesHistory[]> {
+  async getPlayerMinutesHistory(playerId: number, limit: number = 10): Promise<PlayerMinutesWindow[]> {
+    // The estimator only reads minutesPlayed per game, so fetch the narrow
+    // window instead of full 8-column rows; the (playerId, gameweek, season)
+    // unique index serves the player filter and newest-first order
     return db
-      .select()
+      .select({
+        playerId: playerMinutesHistory.playerId,
+        gameweek: playerMinutesHistory.gameweek,
+        minutesPlayed: playerMinutesHistory.minutesPlayed,
+      })
       .from(playerMinutesHistory)
       .where(eq(playerMinutesHistory.playerId, playerId))
       .orderBy(desc(playerMinutesHistory.gameweek))
       .limit(limit);
   }
 
+  // Rows per multi-row upsert statement. Each minutes-history row binds 8
+  // parameters, so 500 rows stays comfortably under the driver's ~65k bound
+  // parameter cap while keeping statements large enough to amortize roundtrips
+  private static readonly BULK_UPSERT_PAGE_SIZE = 500;
+
+  async getPlayerMinutesHistoryBulk(
+    playerIds: number[],
+    limitPerPlayer: number = 10
+  ): Promise<Map<number, PlayerMinutesWindow[]>> {
+    const historyByPlayer = new Map<number, PlayerMinutesWindow[]>();
+    if (playerIds.length === 0) return historyByPlayer;
+
+    // One IN-query for the whole cohort instead of a SELECT per player,
+    // with a ROW_NUMBER window ranking each player's history newest-first
+    // so the database only returns the last `limitPerPlayer` rows per
+    // player rather than every recorded gameweek for trimming in JS
+    const rankedHistory = db.$with('ranked_history').as(
+      db
+        .select({
+          playerId: playerMinutesHistory.playerId,
+          gameweek: playerMinutesHistory.gameweek,
+          minutesPlayed: playerMinutesHistory.minutesPlayed,
+          rowNumber: sql<number>`row_number() over (partition by ${playerMinutesHistory.playerId} order by ${playerMinutesHistory.gameweek} desc)`.as('row_number'),
+        })
+        .from(playerMinutesHistory)
+        .where(inArray(playerMinutesHistory.playerId, playerIds))
+    );
+
+    const rows = await db
+      .with(rankedHistory)
+      .select()
+      .from(rankedHistory)
+      .where(lte(rankedHistory.rowNumber, limitPerPlayer))
+      .orderBy(rankedHistory.playerId, desc(rankedHistory.gameweek));
+
+    for (const { rowNumber: _rowNumber, ...row } of rows) {
+      const history = historyByPlayer.get(row.playerId);
+      if (history) {
+        history.push(row);
+      } else {
+        historyByPlayer.set(row.playerId, [row]);
+      }
+    }
+
+    return historyByPlayer;
+  }
+
   async bulkSavePlayerMinutesHistory(records: InsertPlayerMinutesHistory[]): Promise<void> {
     if (records.length === 0) return;
-    
-    for (const record of records) {
-      await this.savePlayerMinutesHistory(record);
+
+    // One multi-row upsert per page instead of a statement per record
+    for (let i = 0; i < records.length; i += PostgresStorage.BULK_UPSERT_PAGE_SIZE) {
+      const page = records.slice(i, i + PostgresStorage.BULK_UPSERT_PAGE_SIZE);
+      await this.upsertPlayerMinutesPage(page);
     }
   }
 
+  private async upsertPlayerMinutesPage(records: InsertPlayerMinutesHistory[]): Promise<void> {
+    await db
+      .insert(playerMinutesHistory)
+      .values(records)
+      .onConflictDoUpdate({
+        target: [playerMinutesHistory.playerId, playerMinutesHistory.gameweek, playerMinutesHistory.season],
+        set: {
+          minutesPlayed: sql`excluded.minutes_played`,
+          wasInStartingXI: sql`excluded.was_in_starting_xi`,
+          wasSubstituted: sql`excluded.was_substituted`,
+          injuryFlag: sql`excluded.injury_flag`,
+          chanceOfPlaying: sql`excluded.chance_of_playing`,
+        },
+      });
+  }
+
   // Prediction Evaluations methods
+  // Row-independent conflict update for evaluation upserts (values come from
+  // the excluded row), shared by the standalone and transactional paths
+  private static readonly EVALUATION_CONFLICT_SET = {
+    totalPredictions: sql`excluded.total_predictions`,
+    predictionsWithActuals: sql`excluded.predictions_with_actuals`,
+    overallMAE: sql`excluded.overall_mae`,
+    overallBias: sql`excluded.overall_bias`,
+    gkMAE: sql`excluded.gk_mae`,
+    defMAE: sql`excluded.def_mae`,
+    midMAE: sql`excluded.mid_mae`,
+    fwdMAE: sql`excluded.fwd_mae`,
+    gkBias: sql`excluded.gk_bias`,
+    defBias: sql`excluded.def_bias`,
+    midBias: sql`excluded.mid_bias`,
+    fwdBias: sql`excluded.fwd_bias`,
+    topOverpredictions: sql`excluded.top_overpredictions`,
+    topUnderpredictions: sql`excluded.top_underpredictions`,
+    lessonsLearned: sql`excluded.lessons_learned`
+  };
+
   async savePredictionEvaluation(evaluation: InsertPredictionEvaluation): Promise<PredictionEvaluation> {
     const result = await db
       .insert(predictionEvaluations)
       .values(evaluation)
       .onConflictDoUpdate({
         target: predictionEvaluations.gameweek,
-        set: {
-          totalPredictions: evaluation.totalPredictions,
-          predictionsWithActuals: evaluation.predictionsWithActuals,
-          overallMAE: evaluation.overallMAE,
-          overallBias: evaluation.overallBias,
-          gkMAE: evaluation.gkMAE,
-          defMAE: evaluation.defMAE,
-          midMAE: evaluation.midMAE,
-          fwdMAE: evaluation.fwdMAE,
-          gkBias: evaluation.gkBias,
-          defBias: evaluation.defBias,
-          midBias: evaluation.midBias,
-          fwdBias: evaluation.fwdBias,
-          topOverpredictions: evaluation.topOverpredictions,
-          topUnderpredictions: evaluation.topUnderpredictions,
-          lessonsLearned: evaluation.lessonsLearned
-        }
+        set: PostgresStorage.EVALUATION_CONFLICT_SET
       })
       .returning();
     return result[0];
   }
 
+  async saveGameweekEvaluation(
+    evaluation: InsertPredictionEvaluation,
+    biasMetricsRows: InsertPredictionBiasMetrics[]
+  ): Promise<PredictionEvaluation> {
+    // The evaluation row and its bias metrics always change together, so
+    // commit them as one transaction: one flush instead of one per write,
+    // and no window where the evaluation exists without its metrics
+    return db.transaction(async (tx) => {
+      const result = await tx
+        .insert(predictionEvaluations)
+        .values(evaluation)
+        .onConflictDoUpdate({
+          target: predictionEvaluations.gameweek,
+          set: PostgresStorage.EVALUATION_CONFLICT_SET
+        })
+        .returning();
+
+      if (biasMetricsRows.length > 0) {
+        await tx
+          .insert(predictionBiasMetrics)
+          .values(biasMetricsRows)
+          .onConflictDoUpdate({
+            target: [predictionBiasMetrics.gameweek, predictionBiasMetrics.position],
+            set: PostgresStorage.BIAS_METRICS_CONFLICT_SET
+          });
+      }
+
+      return result[0];
+    });
+  }
+
   async getPredictionEvaluation(gameweek: number): Promise<PredictionEvaluation | undefined> {
     const result = await db
       .select()
@@ -1,4 +1,5 @@
 import { statisticalPredictor } from "./statistical-predictor";
+import { minutesEstimator, type MinutesProbability } from "./minutes-estimator";
 import type { FPLPlayer, FPLFixture, FPLTeam, TransferRecommendation } from "@shared/schema";
 
 interface TransferValue {
@@ -19,12 +20,37 @@ interface WildcardPlan {
   reasoning: string;
 }
 
+// Single-pass top-k selection: keeps a small sorted window (descending by
+// score) instead of sorting the whole array when only the best k are needed
+function topKBy<T>(items: T[], k: number, score: (item: T) => number): T[] {
+  if (k <= 0) return [];
+  const top: Array<{ item: T; score: number }> = [];
+  for (const item of items) {
+    const s = score(item);
+    if (top.length === k && s <= top[top.length - 1].score) continue;
+    let lo = 0;
+    let hi = top.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (top[mid].score >= s) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    top.splice(lo, 0, { item, score: s });
+    if (top.length > k) top.pop();
+  }
+  return top.map(entry => entry.item);
+}
+
 export class TransferAnalyzer {
   async analyzeTransferValue(
     player: FPLPlayer,
     fixtures: FPLFixture[],
     teams: FPLTeam[],
-    horizon: number = 5
+    horizon: number = 5,
+    preloadedMinutes?: MinutesProbability
   ): Promise<TransferValue> {
     const upcomingFixtures = fixtures
       .filter(f => !f.finished && f.event && (f.team_h === player.team || f.team_a === player.team))
@@ -34,13 +60,15 @@ export class TransferAnalyzer {
       player,
       upcomingFixtures.slice(0, 3),
       teams,
-      3
+      3,
+      preloadedMinutes
     );
     const prediction5gw = await statisticalPredictor.predictMultipleGameweeks(
       player,
       upcomingFixtures.slice(0, 5),
       teams,
-      5
+      5,
+      preloadedMinutes
     );
 
     const price = player.now_cost / 10;
@@ -119,15 +147,6 @@ export class TransferAnalyzer {
         p.chance_of_playing_this_round !== 0
     );
 
-    const playerValues = await Promise.all(
-      availablePlayers.map(async p => ({
-        player: p,
-        value: await this.analyzeTransferValue(p, fixtures, teams, 5),
-      }))
-    );
-
-    const sortedByValue = playerValues.sort((a, b) => b.value.valueScore - a.value.valueScore);
-
     const targetsByPosition = {
       1: 2,
       2: 5,
@@ -135,6 +154,48 @@ export class TransferAnalyzer {
       4: 3,
     };
 
+    // analyzeTransferValue runs two multi-gameweek projections per player, so
+    // running it for every available player just to keep ~15 is wasteful.
+    // Pre-rank each position with a cheap points-per-cost heuristic and only
+    // project the shortlist.
+    const candidatesPerSlot = 4;
+
+    // Bucket by position in one pass, then take each bucket's top candidates
+    // with a bounded selection rather than a full sort per position
+    const availableByPosition = new Map<number, FPLPlayer[]>();
+    for (const p of availablePlayers) {
+      const bucket = availableByPosition.get(p.element_type);
+      if (bucket) {
+        bucket.push(p);
+      } else {
+        availableByPosition.set(p.element_type, [p]);
+      }
+    }
+
+    const candidates: FPLPlayer[] = [];
+    for (const [positionStr, count] of Object.entries(targetsByPosition)) {
+      const position = parseInt(positionStr);
+      const positionCandidates = topKBy(
+        availableByPosition.get(position) ?? [],
+        count * candidatesPerSlot,
+        p => p.total_points / p.now_cost
+      );
+      candidates.push(...positionCandidates);
+    }
+
+    // Preload minutes history for the whole shortlist in one query so the
+    // per-candidate projections below don't each hit the database
+    const minutesByCandidate = await minutesEstimator.estimateMinutesBulk(candidates);
+
+    const playerValues = await Promise.all(
+      candidates.map(async p => ({
+        player: p,
+        value: await this.analyzeTransferValue(p, fixtures, teams, 5, minutesByCandidate.get(p.id)),
+      }))
+    );
+
+    const sortedByValue = playerValues.sort((a, b) => b.value.valueScore - a.value.valueScore);
+
     const selectedPlayers: FPLPlayer[] = [];
     let remainingBudget = budget;
 
@@ -163,9 +224,12 @@ export class TransferAnalyzer {
         const upcomingFixtures = fixtures
           .filter(f => !f.finished && f.event && (f.team_h === p.team || f.team_a === p.team))
           .slice(0, 5);
+        // Selected players are a subset of the candidates, so their minutes
+        // estimates are already in hand
+        const minutes = minutesByCandidate.get(p.id);
         return Promise.all([
-          statisticalPredictor.predictMultipleGameweeks(p, upcomingFixtures.slice(0, 3), teams, 3),
-          statisticalPredictor.predictMultipleGameweeks(p, upcomingFixtures.slice(0, 5), teams, 5),
+          statisticalPredictor.predictMultipleGameweeks(p, upcomingFixtures.slice(0, 3), teams, 3, minutes),
+          statisticalPredictor.predictMultipleGameweeks(p, upcomingFixtures.slice(0, 5), teams, 5, minutes),
         ]);
       })
     );
@@ -394,7 +394,7 @@ export const fplCredentials = pgTable('fpl_credentials', {
   sessionCookies: text('session_cookies'),
   cookiesExpiresAt: timestamp('cookies_expires_at'),
   createdAt: timestamp('created_at').defaultNow().notNull(),
-  updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  updatedAt: timestamp('updated_at').defaultNow().notNull().$onUpdate(() => new Date()),
 }, (table) => ({
   userIdIdx: index('fpl_credentials_user_id_idx').on(table.userId),
 }));
@@ -414,7 +414,7 @@ export const automationSettings = pgTable('automation_settings', {
   maxTransferHit: integer('max_transfer_hit').default(8).notNull(),
   notificationEnabled: boolean('notification_enabled').default(true).notNull(),
   createdAt: timestamp('created_at').defaultNow().notNull(),
-  updatedAt: timestamp('updated_at').defaultNow().notNull(),
+  updatedAt: timestamp('updated_at').defaultNow().notNull().$onUpdate(() => new Date()),
 }, (table) => ({
   userIdIdx: index('automation_settings_user_id_idx').on(table.userId),
 }));
@@ -510,6 +510,7 @@ export const gameweekPlans = pgTable('gameweek_plans', {
   userIdIdx: index('gameweek_plans_user_id_idx').on(table.userId),
   gameweekIdx: index('gameweek_plans_gameweek_idx').on(table.gameweek),
   userGameweekIdx: index('gameweek_plans_user_gameweek_idx').on(table.userId, table.gameweek),
+  userCreatedAtIdx: index('gameweek_plans_user_created_at_idx').on(table.userId, table.createdAt),
 }));
 
 export const insertGameweekPlanSchema = createInsertSchema(gameweekPlans).omit({ id: true, createdAt: true });
@@ -685,6 +686,7 @@ export const aiPrecomputations = pgTable('ai_precomputations', {
   gameweekIdx: index('ai_precomp_gameweek_idx').on(table.gameweek),
   typeIdx: index('ai_precomp_type_idx').on(table.computationType),
   playerIdIdx: index('ai_precomp_player_id_idx').on(table.playerId),
+  expiresAtIdx: index('ai_precomp_expires_at_idx').on(table.expiresAt),
   snapshotTypePlayerUnique: uniqueIndex('ai_precomp_snapshot_type_player_unique')
     .on(table.snapshotId, table.computationType, table.playerId),
 }));
@@ -716,6 +718,7 @@ export const aiDecisionLedger = pgTable('ai_decision_ledger', {
   snapshotIdIdx: index('ai_decision_snapshot_id_idx').on(table.snapshotId),
   gameweekIdx: index('ai_decision_gameweek_idx').on(table.gameweek),
   decisionTypeIdx: index('ai_decision_type_idx').on(table.decisionType),
+  userCreatedAtIdx: index('ai_decision_user_created_at_idx').on(table.userId, table.createdAt),
 }));
 
 export const insertAiDecisionLedgerSchema = createInsertSchema(aiDecisionLedger).omit({ id: true, createdAt: true });